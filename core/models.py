@@ -1,9 +1,17 @@
-from dataclasses import dataclass, field
-from typing import Optional, List, Dict
+from dataclasses import dataclass, field, fields, astuple
+from typing import Optional, List, Dict, Iterable
 from datetime import datetime
-from enum import Enum
+from enum import Enum, unique
+from functools import lru_cache
+from array import array
+import json
 import re
 
+_NOM_PARTICLES = frozenset(('de', 'du', 'des', 'le', 'la'))
+_EMPTY = ()
+MISSING_ID = -1
+
+@unique
 class ActeType(Enum):
     BAPTEME = "baptême"
     MARIAGE = "mariage"
@@ -12,11 +20,17 @@ class ActeType(Enum):
     DECES = "décès"
     PRISE_POSSESSION = "prise_possession"
 
+    @classmethod
+    def _missing_(cls, value):
+        return _ACTETYPE_BY_VALUE.get(value.strip().lower()) if isinstance(value, str) else None
+
+@unique
 class PersonStatus(Enum):
     SIEUR = "sieur"
     SEIGNEUR = "seigneur"
     ECUYER = "écuyer"
 
+@unique
 class RelationType(Enum):
     PERE = "père"
     MERE = "mère"
@@ -32,6 +46,13 @@ class RelationType(Enum):
     PARRAIN = "parrain"
     MARRAINE = "marraine"
 
+    @classmethod
+    def _missing_(cls, value):
+        return _RELATIONTYPE_BY_VALUE.get(value.strip().lower()) if isinstance(value, str) else None
+
+_ACTETYPE_BY_VALUE = {m.value.lower(): m for m in ActeType}
+_RELATIONTYPE_BY_VALUE = {m.value.lower(): m for m in RelationType}
+
 @dataclass
 class SourceEvent:
     event_type: str
@@ -88,6 +109,47 @@ class Person:
     _primary_prenom: Optional[str] = field(default=None, init=False)
     _search_key: Optional[str] = field(default=None, init=False)
 
+    _RELATION_KEYS = (
+        ("père", "pere_id", True),
+        ("mère", "mere_id", True),
+        ("conjoint", "conjoint_id", True),
+        ("frères", "freres_ids", False),
+        ("soeurs", "soeurs_ids", False),
+        ("neveux", "neveux_ids", False),
+        ("nièces", "nieces_ids", False),
+        ("oncles", "oncles_ids", False),
+        ("tantes", "tantes_ids", False),
+        ("cousins", "cousins_ids", False),
+        ("cousines", "cousines_ids", False),
+        ("parrain", "parrain_id", True),
+        ("marraine", "marraine_id", True),
+        ("filleuls", "filleuls_ids", False),
+    )
+    _FAMILY_RELATION_ATTRS = {
+        RelationType.FRERE: "freres_ids",
+        RelationType.SOEUR: "soeurs_ids",
+        RelationType.NEVEU: "neveux_ids",
+        RelationType.NIECE: "nieces_ids",
+        RelationType.ONCLE: "oncles_ids",
+        RelationType.TANTE: "tantes_ids",
+        RelationType.COUSIN: "cousins_ids",
+        RelationType.COUSINE: "cousines_ids",
+    }
+
+    @classmethod
+    def from_ingest(cls, prenoms: List[str], nom: str, **ids) -> 'Person':
+        unknown = ids.keys() - _PERSON_ID_FIELDS
+        if unknown:
+            raise TypeError(f"Champs d'identifiant inconnus: {sorted(unknown)}")
+        person = cls.__new__(cls)
+        attrs = person.__dict__
+        attrs.update(_PERSON_INGEST_DEFAULTS)
+        attrs.update({name: [] for name in _PERSON_LIST_FIELDS})
+        attrs.update(ids)
+        person.prenoms = prenoms if type(prenoms) is list else list(prenoms)
+        person.nom = nom
+        return person
+
     @property
     def primary_prenom(self) -> str:
         if self._primary_prenom is None:
@@ -128,40 +190,32 @@ class Person:
     def add_source_event(self, event_type: str, source_reference: str, date: str = None, lieu: str = None, **kwargs):
         self.sources_events.append(SourceEvent(event_type=event_type, date=date, lieu=lieu, source_reference=source_reference, **kwargs))
 
+    def extend_source_events(self, rows: Iterable) -> None:
+        self.sources_events.extend([SourceEvent(**row) if isinstance(row, dict) else SourceEvent(*row) for row in rows])
+
     def get_sources_for_event(self, event_type: str) -> List[SourceEvent]:
         return [s for s in self.sources_events if s.event_type == event_type]
 
     def add_family_relation(self, person_id: int, relation_type: RelationType):
-        relation_map = {
-            RelationType.FRERE: self.freres_ids,
-            RelationType.SOEUR: self.soeurs_ids,
-            RelationType.NEVEU: self.neveux_ids,
-            RelationType.NIECE: self.nieces_ids,
-            RelationType.ONCLE: self.oncles_ids,
-            RelationType.TANTE: self.tantes_ids,
-            RelationType.COUSIN: self.cousins_ids,
-            RelationType.COUSINE: self.cousines_ids,
-        }
-        if person_id not in relation_map.get(relation_type, []):
-            relation_map[relation_type].append(person_id)
+        attr = self._FAMILY_RELATION_ATTRS[relation_type]
+        ids = getattr(self, attr)
+        if person_id not in ids:
+            ids.append(person_id)
+
+    def iter_family_ids(self):
+        for label, attr, scalar in self._RELATION_KEYS:
+            value = getattr(self, attr)
+            if scalar:
+                yield label, (value,) if value is not None else _EMPTY
+            else:
+                yield label, value
 
     def get_all_family_ids(self) -> Dict[str, List[int]]:
-        return {
-            "père": [self.pere_id] if self.pere_id else [],
-            "mère": [self.mere_id] if self.mere_id else [],
-            "conjoint": [self.conjoint_id] if self.conjoint_id else [],
-            "frères": self.freres_ids,
-            "soeurs": self.soeurs_ids,
-            "neveux": self.neveux_ids,
-            "nièces": self.nieces_ids,
-            "oncles": self.oncles_ids,
-            "tantes": self.tantes_ids,
-            "cousins": self.cousins_ids,
-            "cousines": self.cousines_ids,
-            "parrain": [self.parrain_id] if self.parrain_id else [],
-            "marraine": [self.marraine_id] if self.marraine_id else [],
-            "filleuls": self.filleuls_ids
-        }
+        return {label: list(ids) if type(ids) is tuple else ids for label, ids in self.iter_family_ids()}
+
+_PERSON_LIST_FIELDS = tuple(f.name for f in fields(Person) if f.default_factory is list)
+_PERSON_INGEST_DEFAULTS = {f.name: f.default for f in fields(Person) if f.default_factory is not list}
+_PERSON_ID_FIELDS = frozenset(f.name for f in fields(Person) if f.type == Optional[int])
 
 @dataclass
 class ActeParoissial:
@@ -236,24 +290,30 @@ class MultiPrenomUtils:
         if not full_name:
             return [], ""
         parts = full_name.strip().split()
-        nom_parts, prenom_parts = [], []
-        for i in range(len(parts) - 1, -1, -1):
-            if parts[i][0].isupper() and (not nom_parts or parts[i].lower() in ['de', 'du', 'des', 'le', 'la']):
-                nom_parts.insert(0, parts[i])
-            else:
-                prenom_parts = parts[:i+1]
+        if not parts:
+            return [], ""
+        n = len(parts)
+        boundary = n
+        while boundary > 0:
+            word = parts[boundary - 1]
+            if not (word[0].isupper() and (boundary == n or word.lower() in _NOM_PARTICLES)):
                 break
-        if not nom_parts:
-            nom_parts = [parts[-1]]
-            prenom_parts = parts[:-1]
+            boundary -= 1
+        if boundary == n:
+            boundary = n - 1
+        prenom_parts, nom_parts = parts[:boundary], parts[boundary:]
         prenoms = MultiPrenomUtils.parse_prenoms(' '.join(prenom_parts))
         nom = ' '.join(nom_parts)
         return prenoms, nom
 
+@lru_cache(maxsize=4096)
+def _base_source_reference(archive: str, collection: str, years: str) -> str:
+    return f"{archive}, {collection} {years}"
+
 class SourceManager:
     @staticmethod
     def create_source_reference(archive: str, collection: str, years: str, page: int = None) -> str:
-        ref = f"{archive}, {collection} {years}"
+        ref = _base_source_reference(archive, collection, years)
         return f"{ref}, p.{page}" if page else ref
 
     @staticmethod
@@ -266,6 +326,113 @@ class SourceManager:
             'page': int(match.group(3)) if match and match.group(3) else None
         }
 
+def _person_column_kind(f) -> str:
+    if f.type == Optional[int]:
+        return 'id'
+    if f.type == List[int]:
+        return 'ids'
+    if f.type == List[SourceEvent]:
+        return 'events'
+    if f.type == Optional[PersonStatus]:
+        return 'statut'
+    if f.type == List[str]:
+        return 'strs'
+    return 'scalar'
+
+_PERSON_COLUMNS = tuple((f.name, _person_column_kind(f)) for f in fields(Person) if f.init)
+
+class PersonTable:
+    def __init__(self, columns: Dict[str, object], size: int):
+        self.columns = columns
+        self.size = size
+
+    def __len__(self) -> int:
+        return self.size
+
+    @classmethod
+    def from_persons(cls, persons: Iterable[Person]) -> 'PersonTable':
+        persons = list(persons)
+        columns = {}
+        for name, kind in _PERSON_COLUMNS:
+            values = [getattr(p, name) for p in persons]
+            if kind == 'id':
+                columns[name] = array('q', [MISSING_ID if v is None else v for v in values])
+            elif kind == 'ids':
+                offsets, flat = array('q', [0]), array('q')
+                for ids in values:
+                    flat.extend(ids)
+                    offsets.append(len(flat))
+                columns[name] = (offsets, flat)
+            elif kind == 'events':
+                columns[name] = [[astuple(e) for e in events] for events in values]
+            elif kind == 'statut':
+                columns[name] = [v.value if v is not None else None for v in values]
+            elif kind == 'strs':
+                columns[name] = [list(v) for v in values]
+            else:
+                columns[name] = values
+        return cls(columns, len(persons))
+
+    def to_persons(self) -> List[Person]:
+        rows = [{} for _ in range(self.size)]
+        for name, kind in _PERSON_COLUMNS:
+            column = self.columns[name]
+            if kind == 'id':
+                for row, v in zip(rows, column):
+                    row[name] = None if v == MISSING_ID else v
+            elif kind == 'ids':
+                offsets, flat = column
+                for i, row in enumerate(rows):
+                    row[name] = flat[offsets[i]:offsets[i + 1]].tolist()
+            elif kind == 'events':
+                for row, events in zip(rows, column):
+                    row[name] = [SourceEvent(*e) for e in events]
+            elif kind == 'statut':
+                for row, v in zip(rows, column):
+                    row[name] = PersonStatus(v) if v is not None else None
+            elif kind == 'strs':
+                for row, v in zip(rows, column):
+                    row[name] = list(v)
+            else:
+                for row, v in zip(rows, column):
+                    row[name] = v
+        return [Person(**row) for row in rows]
+
+    def dump(self, path) -> None:
+        # Colonnes numériques brutes dans path, le reste en JSON dans path.json
+        numeric, others = [], {}
+        with open(path, 'wb') as f:
+            for name, kind in _PERSON_COLUMNS:
+                column = self.columns[name]
+                if kind == 'id':
+                    arrays = (column,)
+                elif kind == 'ids':
+                    arrays = column
+                else:
+                    others[name] = column
+                    continue
+                for values in arrays:
+                    values.tofile(f)
+                numeric.append([name, [len(values) for values in arrays]])
+        with open(f"{path}.json", 'w', encoding='utf-8') as f:
+            json.dump({'size': self.size, 'numeric': numeric, 'columns': others}, f, ensure_ascii=False)
+
+    @classmethod
+    def load(cls, path) -> 'PersonTable':
+        with open(f"{path}.json", 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        columns = data['columns']
+        kinds = dict(_PERSON_COLUMNS)
+        with open(path, 'rb') as f:
+            for name, lengths in data['numeric']:
+                arrays = []
+                for length in lengths:
+                    values = array('q')
+                    values.fromfile(f, length)
+                    arrays.append(values)
+                columns[name] = arrays[0] if kinds[name] == 'id' else tuple(arrays)
+        return cls(columns, data['size'])
+
 # Test et exemples
 if __name__ == "__main__":
     print("=== TEST DES MODÈLES CORRIGÉS ===")
@@ -305,9 +472,8 @@ if __name__ == "__main__":
     person.add_family_relation(123, RelationType.FRERE)
     person.add_family_relation(456, RelationType.COUSIN)
     
-    all_family = person.get_all_family_ids()
     print("Relations familiales:")
-    for relation_type, ids in all_family.items():
+    for relation_type, ids in person.iter_family_ids():
         if ids:
             print(f"  - {relation_type}: {ids}")
     
@@ -1,5 +1,7 @@
 import logging
+from array import array
 from collections import defaultdict
+from functools import partial
 from datetime import datetime
 from core.models import ActeParoissial, ActeType, ValidationResult
 from config.settings import ParserConfig
@@ -11,10 +13,12 @@ class ActeManager:
         self.logger = logging.getLogger(__name__)
         self.actes = {}
         self.acte_id_counter = 1
-        self._year_index = defaultdict(list)
-        self._type_index = defaultdict(list)
-        self._person_index = defaultdict(list)
+        self._year_index = defaultdict(partial(array, 'I'))
+        self._type_index = defaultdict(partial(array, 'I'))
+        self._person_index = defaultdict(partial(array, 'I'))
+        self._parent_index = defaultdict(partial(array, 'I'))
         self.date_parser = DateParser(config)
+        self._death_year_cache = {}
         self.stats = {'actes_created': 0, 'actes_validated': 0, 'chronology_errors': 0}
     
     def create_acte(self, acte_data):
@@ -41,8 +45,12 @@ class ActeManager:
         person_ids = [acte.personne_principale_id, acte.pere_id, acte.mere_id, acte.conjoint_id, acte.parrain_id, acte.marraine_id]
         person_ids.extend(acte.temoin_ids)
         for person_id in person_ids:
-            if person_id:
+            if person_id is not None:
                 self._person_index[person_id].append(acte.id)
+        if acte.pere_id is not None:
+            self._parent_index[acte.pere_id].append(acte.id)
+        if acte.mere_id is not None and acte.mere_id != acte.pere_id:
+            self._parent_index[acte.mere_id].append(acte.id)
     
     def validate_acte(self, acte, person_manager):
         errors = []
@@ -57,23 +65,23 @@ class ActeManager:
         if acte.year:
             person_ids = [acte.personne_principale_id, acte.pere_id, acte.mere_id]
             for person_id in person_ids:
-                if person_id:
+                if person_id is not None:
                     person = person_manager.persons.get(person_id)
                     if person and person.date_deces:
-                        death_year = self.date_parser.get_year_from_text(person.date_deces)
+                        death_year = self._get_death_year(person_id, person.date_deces)
                         if death_year and acte.year > death_year:
                             errors.append(f"Personne {person.full_name} présente dans acte {acte.year} après décès {death_year}")
                             confidence -= 0.4
         if acte.type_acte == ActeType.BAPTEME:
-            if not acte.pere_id and not acte.mere_id:
+            if acte.pere_id is None and acte.mere_id is None:
                 warnings.append("Baptême sans parents identifiés")
                 confidence -= 0.1
         elif acte.type_acte == ActeType.MARIAGE:
-            if not acte.personne_principale_id or not acte.conjoint_id:
+            if acte.personne_principale_id is None or acte.conjoint_id is None:
                 errors.append("Mariage sans époux identifiés")
                 confidence -= 0.3
         elif acte.type_acte == ActeType.INHUMATION:
-            if not acte.personne_principale_id:
+            if acte.personne_principale_id is None:
                 errors.append("Inhumation sans défunt identifié")
                 confidence -= 0.3
         result = ValidationResult(is_valid=len(errors) == 0, errors=errors, warnings=warnings, confidence_score=max(0.0, confidence))
@@ -83,6 +91,17 @@ class ActeManager:
             self.stats['chronology_errors'] += 1
         return result
     
+    def _get_death_year(self, person_id, date_deces):
+        key = (person_id, date_deces)
+        try:
+            return self._death_year_cache[key]
+        except KeyError:
+            death_year = self._death_year_cache[key] = self.date_parser.get_year_from_text(date_deces)
+            return death_year
+    
+    def validate_all(self, person_manager):
+        return {acte_id: self.validate_acte(acte, person_manager) for acte_id, acte in self.actes.items()}
+    
     def get_actes_by_year(self, year):
         acte_ids = self._year_index.get(year, [])
         return [self.actes[aid] for aid in acte_ids]
@@ -99,18 +118,14 @@ class ActeManager:
         person = person_manager.persons.get(person_id)
         if not person:
             return {}
-        family_actes = {'own_actes': self.get_actes_by_person(person_id), 'children_actes': [], 'spouse_actes': []}
-        for acte in self.actes.values():
-            if acte.pere_id == person_id or acte.mere_id == person_id:
-                family_actes['children_actes'].append(acte)
-        if person.conjoint_id:
+        children_actes = [self.actes[aid] for aid in self._parent_index.get(person_id, [])]
+        family_actes = {'own_actes': self.get_actes_by_person(person_id), 'children_actes': children_actes, 'spouse_actes': []}
+        if person.conjoint_id is not None:
             family_actes['spouse_actes'] = self.get_actes_by_person(person.conjoint_id)
         return family_actes
     
     def get_statistics(self):
-        type_counts = {}
-        for acte_type in ActeType:
-            type_counts[acte_type.value] = len(self._type_index[acte_type])
-        years = list(self._year_index.keys())
+        type_counts = {acte_type.value: len(self._type_index.get(acte_type, ())) for acte_type in ActeType}
+        years = self._year_index.keys()
         year_range = (min(years), max(years)) if years else (None, None)
         return {'total_actes': len(self.actes), 'actes_created': self.stats['actes_created'], 'actes_validated': self.stats['actes_validated'], 'chronology_errors': self.stats['chronology_errors'], 'by_type': type_counts, 'year_range': year_range, 'years_covered': len(years), 'validation_rate': (self.stats['actes_validated'] / max(1, self.stats['actes_created'])) * 100}
\ No newline at end of file
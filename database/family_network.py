@@ -1,162 +1,250 @@
 import logging
+import heapq
 from collections import defaultdict, deque
-from dataclasses import dataclass
+from itertools import combinations
+from operator import itemgetter
+from dataclasses import dataclass, field
 from core.models import Person, ActeParoissial
 from config.settings import ParserConfig
 
-@dataclass
+EVIDENCE_PERE = ("Père déclaré de {0.full_name}",)
+EVIDENCE_MERE = ("Mère déclarée de {0.full_name}",)
+EVIDENCE_CONJOINT = ("Conjoint déclaré",)
+EVIDENCE_PARRAIN = ("Parrain lors du baptême {0.date}",)
+EVIDENCE_MARRAINE = ("Marraine lors du baptême {0.date}",)
+EVIDENCE_FRATRIE = ("Enfants du même parent (ID: {0})",)
+EVIDENCE_PARENTS_COMMUNS = ("Parents communs de {0} enfant(s)",)
+EVIDENCE_GRAND_PARENT = ("Grand-parent inféré via {0}",)
+
+@dataclass(slots=True)
 class FamilyRelation:
     person1_id: int
     person2_id: int
     relation_type: str
     confidence: float
-    evidence: list
+    evidence: tuple
+    evidence_args: tuple = ()
+    
+    def get_evidence(self):
+        if self.evidence_args:
+            return [text.format(*self.evidence_args) for text in self.evidence]
+        return list(self.evidence)
 
-@dataclass
+@dataclass(slots=True)
 class FamilyNetwork:
     persons: dict
     relations: list
     generations: dict
     family_groups: list
+    parent_of: dict = field(default_factory=dict)
+    children_of: dict = field(default_factory=dict)
+    _ancestors_cache: dict = field(default_factory=dict, init=False, repr=False, compare=False)
+    
+    def get_ancestors(self, person_id):
+        cache = self._ancestors_cache
+        ancestors = cache.get(person_id)
+        if ancestors is not None:
+            return ancestors
+        parent_of = self.parent_of
+        stack = [person_id]
+        on_path = {person_id}
+        while stack:
+            current_id = stack[-1]
+            parents = parent_of.get(current_id, ())
+            for parent_id in parents:
+                if parent_id not in cache:
+                    if parent_id in on_path:
+                        ancestors = cache[person_id] = _get_ancestors_path(person_id, parent_of)
+                        return ancestors
+                    stack.append(parent_id)
+                    on_path.add(parent_id)
+                    break
+            else:
+                ancestors = dict.fromkeys(parents, 1)
+                for parent_id in parents:
+                    for ancestor_id, distance in cache[parent_id].items():
+                        if ancestors.get(ancestor_id, distance + 2) > distance + 1:
+                            ancestors[ancestor_id] = distance + 1
+                ancestors.pop(current_id, None)
+                cache[current_id] = ancestors
+                stack.pop()
+                on_path.discard(current_id)
+        return cache[person_id]
+    
+    def invalidate_caches(self):
+        self._ancestors_cache.clear()
+
+def _pair_key(person1_id, person2_id):
+    return (person1_id, person2_id) if person1_id < person2_id else (person2_id, person1_id)
+
+def _get_ancestors_path(person_id, parent_of):
+    ancestors = {}
+    queue = deque([(person_id, 0)])
+    visited = set()
+    while queue:
+        current_id, distance = queue.popleft()
+        if current_id in visited:
+            continue
+        visited.add(current_id)
+        if distance > 0:
+            ancestors[current_id] = distance
+        for parent_id in parent_of.get(current_id, ()):
+            if parent_id not in visited:
+                queue.append((parent_id, distance + 1))
+    return ancestors
+
+class UnionFind:
+    __slots__ = ('_index', '_parent', '_rank')
+    
+    def __init__(self):
+        self._index = {}
+        self._parent = []
+        self._rank = bytearray()
+    
+    def __iter__(self):
+        return iter(self._index)
+    
+    def add(self, item):
+        index = self._index.get(item)
+        if index is None:
+            index = self._index[item] = len(self._parent)
+            self._parent.append(index)
+            self._rank.append(0)
+        return index
+    
+    def _find_root(self, index):
+        parent = self._parent
+        while parent[index] != index:
+            parent[index], index = parent[parent[index]], parent[index]
+        return index
+    
+    def find(self, item):
+        return self._find_root(self.add(item))
+    
+    def union(self, item1, item2):
+        root1 = self.find(item1)
+        root2 = self.find(item2)
+        if root1 == root2:
+            return root1
+        rank = self._rank
+        if rank[root1] < rank[root2]:
+            root1, root2 = root2, root1
+        self._parent[root2] = root1
+        if rank[root1] == rank[root2]:
+            rank[root1] += 1
+        return root1
 
 class FamilyNetworkAnalyzer:
+    __slots__ = ('config', 'logger')
+    
     def __init__(self, config):
         self.config = config
         self.logger = logging.getLogger(__name__)
     
     def build_family_network(self, persons, actes):
         self.logger.info(f"Construction du réseau familial pour {len(persons)} personnes")
-        relations = self._extract_all_relations(persons, actes)
-        generations = self._calculate_generations(persons, relations)
-        family_groups = self._identify_family_groups(persons, relations)
-        inferred_relations = self._infer_missing_relations(persons, relations, actes)
+        relations, parent_of, children_of, union_find = self._extract_all_relations(persons, actes)
+        generations = self._calculate_generations(persons, children_of, parent_of)
+        family_groups = self._identify_family_groups(persons, union_find)
+        inferred_relations = self._infer_missing_relations(persons, relations, actes, children_of, parent_of)
         relations.extend(inferred_relations)
-        network = FamilyNetwork(persons=persons, relations=relations, generations=generations, family_groups=family_groups)
+        network = FamilyNetwork(persons=persons, relations=relations, generations=generations, family_groups=family_groups, parent_of=parent_of, children_of=children_of)
         self.logger.info(f"Réseau construit: {len(relations)} relations, {len(family_groups)} groupes familiaux")
         return network
     
     def _extract_all_relations(self, persons, actes):
         relations = []
+        parent_of = defaultdict(list)
+        children_of = defaultdict(list)
+        union_find = UnionFind()
         for person in persons.values():
-            if person.pere_id:
-                relations.append(FamilyRelation(person1_id=person.pere_id, person2_id=person.id, relation_type='parent', confidence=0.95, evidence=[f"Père déclaré de {person.full_name}"]))
-            if person.mere_id:
-                relations.append(FamilyRelation(person1_id=person.mere_id, person2_id=person.id, relation_type='parent', confidence=0.95, evidence=[f"Mère déclarée de {person.full_name}"]))
-            if person.conjoint_id:
-                relations.append(FamilyRelation(person1_id=person.id, person2_id=person.conjoint_id, relation_type='spouse', confidence=0.90, evidence=[f"Conjoint déclaré"]))
+            person_id = person.id
+            for parent_id, evidence in ((person.pere_id, EVIDENCE_PERE), (person.mere_id, EVIDENCE_MERE)):
+                if parent_id is not None:
+                    relations.append(FamilyRelation(person1_id=parent_id, person2_id=person_id, relation_type='parent', confidence=0.95, evidence=evidence, evidence_args=(person,)))
+                    parent_of[person_id].append(parent_id)
+                    children_of[parent_id].append(person_id)
+                    union_find.union(parent_id, person_id)
+            if person.conjoint_id is not None:
+                relations.append(FamilyRelation(person1_id=person_id, person2_id=person.conjoint_id, relation_type='spouse', confidence=0.90, evidence=EVIDENCE_CONJOINT))
+                union_find.union(person_id, person.conjoint_id)
         for acte in actes.values():
-            if acte.parrain_id and acte.personne_principale_id:
-                relations.append(FamilyRelation(person1_id=acte.parrain_id, person2_id=acte.personne_principale_id, relation_type='godparent', confidence=0.85, evidence=[f"Parrain lors du baptême {acte.date}"]))
-            if acte.marraine_id and acte.personne_principale_id:
-                relations.append(FamilyRelation(person1_id=acte.marraine_id, person2_id=acte.personne_principale_id, relation_type='godparent', confidence=0.85, evidence=[f"Marraine lors du baptême {acte.date}"]))
-        return relations
-    
-    def _calculate_generations(self, persons, relations):
-        generations = {}
-        parent_child_graph = defaultdict(list)
-        child_parent_graph = defaultdict(list)
-        for relation in relations:
-            if relation.relation_type == 'parent':
-                parent_child_graph[relation.person1_id].append(relation.person2_id)
-                child_parent_graph[relation.person2_id].append(relation.person1_id)
-        roots = []
-        for person_id in persons.keys():
-            if person_id not in child_parent_graph:
-                roots.append(person_id)
-        queue = deque([(root_id, 0) for root_id in roots])
-        visited = set()
+            if acte.parrain_id is not None and acte.personne_principale_id is not None:
+                relations.append(FamilyRelation(person1_id=acte.parrain_id, person2_id=acte.personne_principale_id, relation_type='godparent', confidence=0.85, evidence=EVIDENCE_PARRAIN, evidence_args=(acte,)))
+            if acte.marraine_id is not None and acte.personne_principale_id is not None:
+                relations.append(FamilyRelation(person1_id=acte.marraine_id, person2_id=acte.personne_principale_id, relation_type='godparent', confidence=0.85, evidence=EVIDENCE_MARRAINE, evidence_args=(acte,)))
+        return relations, dict(parent_of), dict(children_of), union_find
+    
+    def _calculate_generations(self, persons, children_of, parent_of):
+        in_degree = {child_id: len(parent_ids) for child_id, parent_ids in parent_of.items()}
+        levels = {}
+        queue = deque()
+        for parent_id in children_of.keys():
+            if parent_id not in in_degree:
+                levels[parent_id] = 0
+                queue.append(parent_id)
         while queue:
-            person_id, generation = queue.popleft()
-            if person_id in visited:
-                continue
-            visited.add(person_id)
-            generations[person_id] = generation
-            for child_id in parent_child_graph[person_id]:
-                if child_id not in visited:
-                    queue.append((child_id, generation + 1))
-        for person_id in persons.keys():
-            if person_id not in generations:
-                generations[person_id] = 0
-        return generations
-    
-    def _identify_family_groups(self, persons, relations):
-        graph = defaultdict(set)
-        for relation in relations:
-            if relation.relation_type in ['parent', 'spouse', 'sibling']:
-                graph[relation.person1_id].add(relation.person2_id)
-                graph[relation.person2_id].add(relation.person1_id)
-        visited = set()
-        family_groups = []
+            parent_id = queue.popleft()
+            generation = levels[parent_id] + 1
+            for child_id in children_of.get(parent_id, ()):
+                if levels.get(child_id, -1) < generation:
+                    levels[child_id] = generation
+                in_degree[child_id] -= 1
+                if in_degree[child_id] == 0:
+                    queue.append(child_id)
+        in_cycle = {person_id for person_id, degree in in_degree.items() if degree > 0}
+        if in_cycle:
+            self.logger.warning(f"Cycle de filiation détecté: {len(in_cycle)} personnes sans génération calculée")
+        return {person_id: 0 if person_id in in_cycle else levels.get(person_id, 0) for person_id in persons.keys()}
+    
+    def _identify_family_groups(self, persons, union_find):
+        groups_by_root = {}
         for person_id in persons.keys():
-            if person_id not in visited:
-                group = self._dfs_family_group(person_id, graph, visited)
-                if len(group) > 1:
-                    family_groups.append(group)
-        return family_groups
-    
-    def _dfs_family_group(self, start_id, graph, visited):
-        group = set()
-        stack = [start_id]
-        while stack:
-            person_id = stack.pop()
-            if person_id in visited:
-                continue
-            visited.add(person_id)
-            group.add(person_id)
-            for connected_id in graph[person_id]:
-                if connected_id not in visited:
-                    stack.append(connected_id)
-        return group
-    
-    def _infer_missing_relations(self, persons, existing_relations, actes):
+            groups_by_root.setdefault(union_find.find(person_id), set()).add(person_id)
+        for member_id in union_find:
+            group = groups_by_root.get(union_find.find(member_id))
+            if group is not None:
+                group.add(member_id)
+        return [group for group in groups_by_root.values() if len(group) > 1]
+    
+    def _infer_missing_relations(self, persons, existing_relations, actes, children_of, parent_of):
         inferred_relations = []
-        siblings = self._infer_sibling_relations(persons, existing_relations)
+        siblings = self._infer_sibling_relations(persons, children_of)
         inferred_relations.extend(siblings)
         marriages = self._infer_marriage_relations(persons, existing_relations)
         inferred_relations.extend(marriages)
-        grandparent_relations = self._infer_grandparent_relations(persons, existing_relations)
+        grandparent_relations = self._infer_grandparent_relations(persons, parent_of)
         inferred_relations.extend(grandparent_relations)
         return inferred_relations
     
-    def _infer_sibling_relations(self, persons, relations):
+    def _infer_sibling_relations(self, persons, children_of):
         siblings = []
-        children_by_parents = defaultdict(list)
-        for relation in relations:
-            if relation.relation_type == 'parent':
-                parent_id = relation.person1_id
-                child_id = relation.person2_id
-                children_by_parents[parent_id].append(child_id)
-        for parent_id, children in children_by_parents.items():
+        for parent_id, children in children_of.items():
             if len(children) > 1:
-                for i, child1_id in enumerate(children):
-                    for child2_id in children[i+1:]:
-                        siblings.append(FamilyRelation(person1_id=child1_id, person2_id=child2_id, relation_type='sibling', confidence=0.85, evidence=[f"Enfants du même parent (ID: {parent_id})"]))
+                evidence_args = (parent_id,)
+                for child1_id, child2_id in combinations(children, 2):
+                    siblings.append(FamilyRelation(person1_id=child1_id, person2_id=child2_id, relation_type='sibling', confidence=0.85, evidence=EVIDENCE_FRATRIE, evidence_args=evidence_args))
         return siblings
     
     def _infer_marriage_relations(self, persons, relations):
         marriages = []
         parent_pairs = defaultdict(list)
         for person in persons.values():
-            if person.pere_id and person.mere_id:
-                pair_key = tuple(sorted([person.pere_id, person.mere_id]))
-                parent_pairs[pair_key].append(person.id)
-        existing_marriages = {(rel.person1_id, rel.person2_id) for rel in relations if rel.relation_type == 'spouse'}
-        for (parent1_id, parent2_id), children in parent_pairs.items():
-            pair_key = tuple(sorted([parent1_id, parent2_id]))
+            if person.pere_id is not None and person.mere_id is not None:
+                parent_pairs[_pair_key(person.pere_id, person.mere_id)].append(person.id)
+        existing_marriages = {_pair_key(rel.person1_id, rel.person2_id) for rel in relations if rel.relation_type == 'spouse'}
+        for pair_key, children in parent_pairs.items():
+            parent1_id, parent2_id = pair_key
             if pair_key not in existing_marriages and len(children) > 0:
-                marriages.append(FamilyRelation(person1_id=parent1_id, person2_id=parent2_id, relation_type='spouse', confidence=0.80, evidence=[f"Parents communs de {len(children)} enfant(s)"]))
+                marriages.append(FamilyRelation(person1_id=parent1_id, person2_id=parent2_id, relation_type='spouse', confidence=0.80, evidence=EVIDENCE_PARENTS_COMMUNS, evidence_args=(len(children),)))
         return marriages
     
-    def _infer_grandparent_relations(self, persons, relations):
+    def _infer_grandparent_relations(self, persons, parent_of):
         grandparent_relations = []
-        parent_child_map = {}
-        for relation in relations:
-            if relation.relation_type == 'parent':
-                parent_child_map[relation.person2_id] = relation.person1_id
-        for person_id, parent_id in parent_child_map.items():
-            grandparent_id = parent_child_map.get(parent_id)
-            if grandparent_id:
-                grandparent_relations.append(FamilyRelation(person1_id=grandparent_id, person2_id=person_id, relation_type='grandparent', confidence=0.75, evidence=[f"Grand-parent inféré via {parent_id}"]))
+        for person_id, parent_ids in parent_of.items():
+            for parent_id in parent_ids:
+                for grandparent_id in parent_of.get(parent_id, ()):
+                    grandparent_relations.append(FamilyRelation(person1_id=grandparent_id, person2_id=person_id, relation_type='grandparent', confidence=0.75, evidence=EVIDENCE_GRAND_PARENT, evidence_args=(parent_id,)))
         return grandparent_relations
     
     def analyze_family_patterns(self, network):
@@ -165,42 +253,29 @@ class FamilyNetworkAnalyzer:
             analysis['relation_types'][relation.relation_type] += 1
         if network.family_groups:
             analysis['largest_family'] = max(len(group) for group in network.family_groups)
+        spouse_of = defaultdict(list)
+        for relation in network.relations:
+            if relation.relation_type == 'spouse':
+                spouse_of[relation.person1_id].append(relation.person2_id)
+                if relation.person2_id != relation.person1_id:
+                    spouse_of[relation.person2_id].append(relation.person1_id)
         couples_with_children = defaultdict(int)
         for relation in network.relations:
             if relation.relation_type == 'parent':
                 parent_id = relation.person1_id
-                for other_rel in network.relations:
-                    if (other_rel.relation_type == 'spouse' and parent_id in [other_rel.person1_id, other_rel.person2_id]):
-                        couple_key = tuple(sorted([other_rel.person1_id, other_rel.person2_id]))
-                        couples_with_children[couple_key] += 1
+                for spouse_id in spouse_of.get(parent_id, ()):
+                    couples_with_children[_pair_key(parent_id, spouse_id)] += 1
         if couples_with_children:
             analysis['average_children_per_couple'] = sum(couples_with_children.values()) / len(couples_with_children)
         return dict(analysis)
     
-    def find_common_ancestors(self, person1_id, person2_id, network):
-        ancestors1 = self._get_ancestors_path(person1_id, network.relations)
-        ancestors2 = self._get_ancestors_path(person2_id, network.relations)
-        common_ancestors = []
-        for ancestor_id in ancestors1:
-            if ancestor_id in ancestors2:
-                distance1 = ancestors1[ancestor_id]
-                distance2 = ancestors2[ancestor_id]
-                common_ancestors.append((ancestor_id, distance1 + distance2))
-        common_ancestors.sort(key=lambda x: x[1])
+    def find_common_ancestors(self, person1_id, person2_id, network, k=None):
+        ancestors1 = network.get_ancestors(person1_id)
+        ancestors2 = network.get_ancestors(person2_id)
+        if len(ancestors2) < len(ancestors1):
+            ancestors1, ancestors2 = ancestors2, ancestors1
+        common_ancestors = [(ancestor_id, distance + ancestors2[ancestor_id]) for ancestor_id, distance in ancestors1.items() if ancestor_id in ancestors2]
+        if k is not None:
+            return heapq.nsmallest(k, common_ancestors, key=itemgetter(1))
+        common_ancestors.sort(key=itemgetter(1))
         return common_ancestors
-    
-    def _get_ancestors_path(self, person_id, relations):
-        ancestors = {}
-        queue = deque([(person_id, 0)])
-        visited = set()
-        while queue:
-            current_id, distance = queue.popleft()
-            if current_id in visited:
-                continue
-            visited.add(current_id)
-            if distance > 0:
-                ancestors[current_id] = distance
-            for relation in relations:
-                if (relation.relation_type == 'parent' and relation.person2_id == current_id and relation.person1_id not in visited):
-                    queue.append((relation.person1_id, distance + 1))
-        return ancestors
\ No newline at end of file
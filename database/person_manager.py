@@ -5,19 +5,120 @@ Version finale corrigée avec toutes les dépendances et optimisations
 """
 
 import re
+import sys
 import logging
 import hashlib
 from typing import Dict, List, Optional, Set, Tuple, Union, Any
 from datetime import datetime, date
 from functools import lru_cache
-from collections import defaultdict, Counter
+from collections import defaultdict, Counter, OrderedDict
 from enum import Enum
 from dataclasses import dataclass, field
 import unicodedata
+from types import MappingProxyType
+from operator import eq
+from itertools import chain
 
 # Configuration du logging
 logger = logging.getLogger(__name__)
 
+# Nombre de noms normalisés conservés par PersonManager
+NORMALIZE_CACHE_SIZE = 2000
+
+# Prénoms servant à inférer le genre (construits une seule fois)
+PRENOMS_MASCULINS = frozenset({
+    'jean', 'pierre', 'jacques', 'françois', 'antoine', 'louis', 'nicolas',
+    'charles', 'guillaume', 'michel', 'philippe', 'henri', 'claude', 'andré'
+})
+
+PRENOMS_FEMININS = frozenset({
+    'marie', 'anne', 'catherine', 'marguerite', 'françoise', 'jeanne', 'louise',
+    'madeleine', 'michelle', 'nicole', 'claire', 'brigitte', 'monique', 'sylvie'
+})
+
+# Corrections OCR pour noms de personnes (erreur -> forme correcte), en lecture seule
+CORRECTIONS_OCR_NOMS = MappingProxyType({
+    # === ERREURS "Aii" SYSTÉMATIQUES ===
+    'Aiicelle': 'Ancelle',
+    'Aiiber': 'Auber',
+    'Aiieelle': 'Ancelle', 
+    'Aiigotin': 'Antigotin',
+    'Aiimont': 'Aumont',
+    'Aiil': 'Anil',
+    'Aiine': 'Anne',
+    'Aiivray': 'Auvray',
+    'Aii-': 'Anne',
+    
+    # === ERREURS TRANSCRIPTION COURANTES ===
+    'Jaeques': 'Jacques',
+    'Franteois': 'François',
+    'Catlierhie': 'Catherine',
+    'Guillaïune': 'Guillaume',
+    'Iagdeleine': 'Madeleine',
+    'Pi-ançois': 'François',
+    'Nicollas': 'Nicolas',
+    'Toussaiut': 'Toussaint',
+    'Muiiie': 'Marie',
+    'Jlagdeleiue': 'Madeleine',
+    'Cliarles': 'Charles',
+    'Jeau': 'Jean',
+    'Vietoire': 'Victoire',
+    
+    # === NOMS TRONQUÉS IDENTIFIÉS ===
+    'Ade-': 'Adeline',
+    'Marie- An': 'Marie-Anne',
+    'Adrienne-': 'Adrienne',
+    'Afigus-': 'Affiches',
+    'Agnès-': 'Agnès',
+    'Amfr-': 'Amfreville',
+    'An-': 'Anne',
+    'Ame-': 'Amélie',
+    'Alal-': 'Alain',
+    'Alau-': 'Alain',
+    'Alexandre-': 'Alexandre',
+    'Aimée-': 'Aimée',
+    'Aimép': 'Aimée',
+    
+    # === CORRECTIONS ADDITIONNELLES ===
+    'Padelaine': 'Madeleine',
+    'Cardinne': 'Catherine',
+    'Gabi-iel': 'Gabriel',
+    'Eléonore': 'Éléonore',
+    
+    # === CORRECTIONS SUPPLÉMENTAIRES ===
+    'Anthoine': 'Antoine',
+    'Jehan': 'Jean',
+    'Guilleaume': 'Guillaume',
+    'Magdaleine': 'Madeleine',
+    'Françoys': 'François'
+})
+
+def _copier_metadata(valeur: Any) -> Any:
+    """Copie les dictionnaires et listes de métadonnées (les valeurs simples sont partagées)"""
+    if isinstance(valeur, dict):
+        return {cle: _copier_metadata(v) for cle, v in valeur.items()}
+    if isinstance(valeur, list):
+        return list(valeur)
+    return valeur
+
+@lru_cache(maxsize=4096)
+def _nfc(nom: str) -> str:
+    """Forme Unicode composée (NFC) d'un nom, mémorisée pour tous les gestionnaires"""
+    return unicodedata.normalize('NFC', nom)
+
+@lru_cache(maxsize=NORMALIZE_CACHE_SIZE)
+def _forme_comparaison(nom: str) -> str:
+    """Forme minuscule à espaces simples utilisée pour comparer deux noms"""
+    return ' '.join(nom.lower().split())
+
+@lru_cache(maxsize=NORMALIZE_CACHE_SIZE)
+def _cle_blocage_nom(nom: str, particules: frozenset) -> str:
+    """Trois premières lettres du dernier mot hors particules, mémorisées par nom"""
+    for mot in reversed(nom.lower().split()):
+        if mot not in particules:
+            return mot[:3]
+    return ''
+
 # === MODÈLES DE DONNÉES ===
 
 class PersonStatus(Enum):
@@ -41,7 +142,47 @@ class Gender(Enum):
     FEMININ = "F"
     INCONNU = "?"
 
-@dataclass
+# Motifs de statut social (avec corrections OCR), par ordre de priorité
+MOTIFS_STATUT = (
+    ('seigneur', PersonStatus.SEIGNEUR),
+    ('sgr', PersonStatus.SEIGNEUR),
+    ('messire', PersonStatus.SEIGNEUR),
+    ('ecuyer', PersonStatus.ECUYER),
+    ('écuyer', PersonStatus.ECUYER),
+    ('éc.', PersonStatus.ECUYER),
+    ('ec.', PersonStatus.ECUYER),
+    ('sieur', PersonStatus.SIEUR),
+    ('sr', PersonStatus.SIEUR),
+    ('damoiselle', PersonStatus.DAMOISELLE),
+    ('bourgeois', PersonStatus.BOURGEOIS),
+    ('marchand', PersonStatus.MARCHAND),
+    ('laboureur', PersonStatus.LABOUREUR),
+    ('prêtre', PersonStatus.PRETRE),
+    ('pretre', PersonStatus.PRETRE),
+    ('curé', PersonStatus.PRETRE),
+    ('cure', PersonStatus.PRETRE)
+)
+
+@lru_cache(maxsize=1024)
+def _statut_depuis_texte(statut_str: str) -> Optional[PersonStatus]:
+    """Statut correspondant au premier motif présent, dans l'ordre de priorité"""
+    statut_lower = statut_str.lower().strip()
+    for pattern, status in MOTIFS_STATUT:
+        if pattern in statut_lower:
+            return status
+    return None
+
+@lru_cache(maxsize=1024)
+def _genre_depuis_texte(genre_str: str) -> Gender:
+    """Genre correspondant à une saisie libre (m, femme, ...)"""
+    genre_lower = genre_str.lower().strip()
+    if genre_lower in ('m', 'masculin', 'homme', 'h'):
+        return Gender.MASCULIN
+    elif genre_lower in ('f', 'féminin', 'feminin', 'femme'):
+        return Gender.FEMININ
+    return Gender.INCONNU
+
+@dataclass(slots=True)
 class Profession:
     """Métier d'une personne"""
     nom: str
@@ -49,7 +190,7 @@ class Profession:
     lieu: Optional[str] = None
     statut: Optional[str] = None
 
-@dataclass 
+@dataclass(slots=True)
 class Person:
     """Modèle de personne enrichi"""
     # Identité
@@ -86,6 +227,11 @@ class Person:
     # Identifiants
     id_personne: Optional[str] = None
     
+    # Index des sources et noms de professions déjà présents (construits au premier ajout ;
+    # sources et professions ne se modifient ensuite que par ajouter_source / ajouter_profession)
+    _sources_vues: Optional[Set[str]] = field(default=None, init=False, repr=False, compare=False)
+    _professions_vues: Optional[Set[str]] = field(default=None, init=False, repr=False, compare=False)
+    
     def __post_init__(self):
         """Validation et normalisation post-initialisation"""
         if not self.id_personne:
@@ -98,7 +244,29 @@ class Person:
     def _generate_id(self) -> str:
         """Génère un ID unique pour la personne"""
         content = f"{self.nom_complet}_{self.date_naissance}_{self.lieu_naissance}"
-        return hashlib.sha256(content.encode('utf-8')).hexdigest()[:16]
+        return hashlib.blake2b(content.encode('utf-8'), digest_size=8).hexdigest()
+    
+    def ajouter_source(self, source: str) -> bool:
+        """Ajoute une source si elle est absente (test en O(1))"""
+        vues = self._sources_vues
+        if vues is None:
+            vues = self._sources_vues = set(self.sources)
+        if source in vues:
+            return False
+        vues.add(source)
+        self.sources.append(source)
+        return True
+    
+    def ajouter_profession(self, profession: Profession) -> bool:
+        """Ajoute une profession si aucune du même nom n'est présente (test en O(1))"""
+        vues = self._professions_vues
+        if vues is None:
+            vues = self._professions_vues = {p.nom for p in self.professions}
+        if profession.nom in vues:
+            return False
+        vues.add(profession.nom)
+        self.professions.append(profession)
+        return True
     
     def _validate_dates(self):
         """Valide la cohérence des dates"""
@@ -119,22 +287,12 @@ class Person:
         if self.genre != Gender.INCONNU:
             return
         
-        prenoms_masculins = {
-            'jean', 'pierre', 'jacques', 'françois', 'antoine', 'louis', 'nicolas',
-            'charles', 'guillaume', 'michel', 'philippe', 'henri', 'claude', 'andré'
-        }
-        
-        prenoms_feminins = {
-            'marie', 'anne', 'catherine', 'marguerite', 'françoise', 'jeanne', 'louise',
-            'madeleine', 'michelle', 'nicole', 'claire', 'brigitte', 'monique', 'sylvie'
-        }
-        
         for prenom in self.prenoms:
             prenom_lower = prenom.lower()
-            if prenom_lower in prenoms_masculins:
+            if prenom_lower in PRENOMS_MASCULINS:
                 self.genre = Gender.MASCULIN
                 break
-            elif prenom_lower in prenoms_feminins:
+            elif prenom_lower in PRENOMS_FEMININS:
                 self.genre = Gender.FEMININ
                 break
 
@@ -146,9 +304,21 @@ class PersonManager:
         
         # Configuration du cache
         self.cache_size = cache_size
-        self.persons_cache = {}
-        self.name_variations_cache = {}
-        self._cache_access_count = defaultdict(int)
+        self.persons_cache = OrderedDict()
+        self.name_variations_cache = OrderedDict()
+        self._normalize_cache = OrderedDict()
+        
+        # Index de blocage : clé de blocage -> clés du cache (ensemble ordonné)
+        self._blocs = defaultdict(dict)
+        self._bloc_par_cle = {}
+        # Index inverse id(personne) -> clés du cache, et blocs à revérifier pour les doublons
+        self._cles_par_personne = {}
+        self._blocs_a_verifier = set()
+        # Somme des confiances des entrées du cache (moyenne en O(1))
+        self._somme_confiances = 0.0
+        
+        # Professions données par leur seul nom : une instance par nom
+        self._professions_partagees = {}
         
         # Statistiques enrichies
         self.stats = {
@@ -163,63 +333,8 @@ class PersonManager:
             'errors_handled': 0
         }
         
-        # Dictionnaire de corrections OCR pour noms de personnes
-        self.corrections_ocr_noms = {
-            # === ERREURS "Aii" SYSTÉMATIQUES ===
-            'Aiicelle': 'Ancelle',
-            'Aiiber': 'Auber',
-            'Aiieelle': 'Ancelle', 
-            'Aiigotin': 'Antigotin',
-            'Aiimont': 'Aumont',
-            'Aiil': 'Anil',
-            'Aiine': 'Anne',
-            'Aiivray': 'Auvray',
-            'Aii-': 'Anne',
-            
-            # === ERREURS TRANSCRIPTION COURANTES ===
-            'Jaeques': 'Jacques',
-            'Franteois': 'François',
-            'Catlierhie': 'Catherine',
-            'Guillaïune': 'Guillaume',
-            'Iagdeleine': 'Madeleine',
-            'Pi-ançois': 'François',
-            'Nicollas': 'Nicolas',
-            'Toussaiut': 'Toussaint',
-            'Muiiie': 'Marie',
-            'Jlagdeleiue': 'Madeleine',
-            'Cliarles': 'Charles',
-            'Jeau': 'Jean',
-            'Vietoire': 'Victoire',
-            
-            # === NOMS TRONQUÉS IDENTIFIÉS ===
-            'Ade-': 'Adeline',
-            'Marie- An': 'Marie-Anne',
-            'Adrienne-': 'Adrienne',
-            'Afigus-': 'Affiches',
-            'Agnès-': 'Agnès',
-            'Amfr-': 'Amfreville',
-            'An-': 'Anne',
-            'Ame-': 'Amélie',
-            'Alal-': 'Alain',
-            'Alau-': 'Alain',
-            'Alexandre-': 'Alexandre',
-            'Aimée-': 'Aimée',
-            'Aimép': 'Aimée',
-            
-            # === CORRECTIONS ADDITIONNELLES ===
-            'Padelaine': 'Madeleine',
-            'Cardinne': 'Catherine',
-            'Gabi-iel': 'Gabriel',
-            'Eléonore': 'Éléonore',
-            
-            # === CORRECTIONS SUPPLÉMENTAIRES ===
-            'Anthoine': 'Antoine',
-            'Jehan': 'Jean',
-            'Guilleaume': 'Guillaume',
-            'Magdaleine': 'Madeleine',
-            'Anthoine': 'Antoine',
-            'Françoys': 'François'
-        }
+        # Dictionnaire de corrections OCR pour noms de personnes (partagé, lecture seule)
+        self.corrections_ocr_noms = CORRECTIONS_OCR_NOMS
         
         # Variantes orthographiques historiques normalisées
         self.variantes_historiques = {
@@ -238,11 +353,33 @@ class PersonManager:
             'Marguerite': ['Marguerite', 'Margueritte', 'Marguarite', 'Margrite']
         }
         
+        # Heuristiques de complétion des noms tronqués (début → nom complet)
+        self.completions_courantes = {
+            'Alex': 'Alexandre',
+            'Cath': 'Catherine', 
+            'Fran': 'François',
+            'Guil': 'Guillaume',
+            'Madel': 'Madeleine',
+            'Antho': 'Antoine',
+            'Nico': 'Nicolas',
+            'Marg': 'Marguerite',
+            'Pier': 'Pierre',
+            'Jacq': 'Jacques',
+            'Mich': 'Michel',
+            'Phil': 'Philippe',
+            'Char': 'Charles',
+            'Lou': 'Louis',
+            'Hen': 'Henri'
+        }
+        
         # Configuration de normalisation
         self._setup_normalization_rules()
         
         # Patterns pré-compilés pour performance
         self._compile_patterns()
+        
+        # Index de préfixes pour la complétion des noms tronqués
+        self._construire_tries_completion()
     
     def _setup_normalization_rules(self):
         """Configure les règles de normalisation avancées"""
@@ -270,14 +407,14 @@ class PersonManager:
             },
             
             # Particules nobiliaires
-            'particules': ['de', 'du', 'des', 'le', 'la', 'les', 'von', 'van', 'di', 'da'],
+            'particules': frozenset({'de', 'du', 'des', 'le', 'la', 'les', 'von', 'van', 'di', 'da'}),
             
-            # Suffixes à nettoyer
+            # Suffixes à nettoyer (mots seuls, retirés avec tout ce qui suit la virgule)
             'suffixes_nettoyer': [
-                r',\s*écuyer.*$', r',\s*seigneur.*$', r',\s*sieur.*$',
-                r',\s*prêtre.*$', r',\s*curé.*$', r',\s*marchand.*$',
-                r',\s*laboureur.*$', r',\s*notable.*$', r',\s*bourgeois.*$',
-                r',\s*artisan.*$', r',\s*maître.*$'
+                'écuyer', 'seigneur', 'sieur',
+                'prêtre', 'curé', 'marchand',
+                'laboureur', 'notable', 'bourgeois',
+                'artisan', 'maître'
             ]
         }
     
@@ -286,14 +423,32 @@ class PersonManager:
         
         self.compiled_patterns = {}
         
-        # Patterns pour titres
-        for titre_brut, titre_normalise in self.normalization_rules['titres_prefixes'].items():
-            pattern = rf'^{re.escape(titre_brut)}\s+'
-            self.compiled_patterns[f'titre_{titre_brut}'] = re.compile(pattern, re.IGNORECASE)
+        # Titres : une alternance ancrée, un groupe par titre dans l'ordre de priorité
+        titres_prefixes = self.normalization_rules['titres_prefixes']
+        self._titres_normalises = tuple(titres_prefixes.values())
+        self.compiled_patterns['titres'] = re.compile(
+            r'^(?:' + '|'.join(f'({re.escape(titre_brut)})' for titre_brut in titres_prefixes) + r')\s+', re.IGNORECASE
+        )
+        
+        # Suffixes : une seule alternance ',\s*(?:écuyer|seigneur|...).*$'
+        suffixes = dict.fromkeys(self.normalization_rules['suffixes_nettoyer'])
+        self.compiled_patterns['suffixes'] = re.compile(
+            r',\s*(?:' + '|'.join(map(re.escape, suffixes)) + r').*$', re.IGNORECASE
+        )
         
-        # Patterns pour suffixes
-        for i, suffixe_pattern in enumerate(self.normalization_rules['suffixes_nettoyer']):
-            self.compiled_patterns[f'suffixe_{i}'] = re.compile(suffixe_pattern, re.IGNORECASE)
+        # Corrections OCR : une seule alternance, clés les plus longues d'abord
+        erreurs_ocr = sorted(self.corrections_ocr_noms, key=len, reverse=True)
+        self.compiled_patterns['corrections_ocr'] = re.compile('|'.join(map(re.escape, erreurs_ocr)))
+        
+        # Variantes historiques : variante (minuscules) -> forme canonique, mots entiers
+        self._variante_vers_canonique = {}
+        for nom_standard, variantes in self.variantes_historiques.items():
+            for variante in variantes:
+                self._variante_vers_canonique.setdefault(variante.lower(), nom_standard)
+        variantes_triees = sorted(self._variante_vers_canonique, key=len, reverse=True)
+        self.compiled_patterns['variantes_historiques'] = re.compile(
+            r'\b(?:' + '|'.join(map(re.escape, variantes_triees)) + r')\b', re.IGNORECASE
+        )
         
         # Patterns communs
         self.compiled_patterns['nom_tronque'] = re.compile(r'\w+-\s*$')
@@ -301,29 +456,37 @@ class PersonManager:
         self.compiled_patterns['espaces_multiples'] = re.compile(r'\s+')
         self.compiled_patterns['caracteres_speciaux'] = re.compile(r'[^\w\s\-\'\.,;:àáâãäåæçèéêëìíîïðñòóôõö÷øùúûüýþÿÀ-ÿ]')
     
+    def _construire_tries_completion(self):
+        """Construit les tries (dictionnaires imbriqués) de complétion des noms tronqués"""
+        
+        # Chaque préfixe d'une variante pointe vers la première forme canonique qui le contient
+        self._trie_variantes = {}
+        for nom_complet, variantes in self.variantes_historiques.items():
+            for variante in variantes:
+                noeud = self._trie_variantes
+                noeud.setdefault(None, nom_complet)
+                for caractere in variante:
+                    noeud = noeud.setdefault(caractere, {})
+                    noeud.setdefault(None, nom_complet)
+        
+        # Chaque début connu se termine sur (rang, complétion) pour garder l'ordre de priorité
+        self._trie_debuts = {}
+        for rang, (debut, complet) in enumerate(self.completions_courantes.items()):
+            noeud = self._trie_debuts
+            for caractere in debut:
+                noeud = noeud.setdefault(caractere, {})
+            noeud.setdefault(None, (rang, complet))
+    
     def _manage_cache_memory(self):
-        """Gestion intelligente de la mémoire cache avec algorithme LRU approximatif"""
+        """Gestion de la mémoire cache par éviction LRU (entrées les moins récemment utilisées)"""
         
-        if len(self.persons_cache) > self.cache_size:
-            # Trier par nombre d'accès et garder les plus utilisés
-            sorted_cache = sorted(
-                self._cache_access_count.items(),
-                key=lambda x: x[1]
-            )
-            
-            # Supprimer les 20% les moins utilisés
-            to_remove = int(self.cache_size * 0.2)
-            for key, _ in sorted_cache[:to_remove]:
-                self.persons_cache.pop(key, None)
-                self._cache_access_count.pop(key, None)
-        
-        # Nettoyer le cache de variations de noms
-        if len(self.name_variations_cache) > self.cache_size // 2:
-            # Garder seulement les plus récents
-            items = list(self.name_variations_cache.items())
-            self.name_variations_cache = dict(items[-self.cache_size//4:])
-    
-    @lru_cache(maxsize=2000)
+        while len(self.persons_cache) > self.cache_size:
+            self._retirer_du_cache(next(iter(self.persons_cache)))
+        
+        # Borner le cache de variations de noms
+        while len(self.name_variations_cache) > self.cache_size // 2:
+            self.name_variations_cache.popitem(last=False)
+    
     def normalize_person_name(self, nom: str, appliquer_corrections_ocr: bool = True) -> Tuple[str, Dict]:
         """
         Normalisation enrichie avec corrections OCR intégrées et gestion d'erreurs
@@ -338,6 +501,48 @@ class PersonManager:
         Raises:
             ValueError: Si le nom est invalide
         """
+        cle = (nom, appliquer_corrections_ocr)
+        resultat = self._normalize_cache.get(cle)
+        if resultat is None:
+            resultat = self._normaliser_nom(nom, appliquer_corrections_ocr)
+            self._normalize_cache[cle] = resultat
+            if len(self._normalize_cache) > NORMALIZE_CACHE_SIZE:
+                self._normalize_cache.popitem(last=False)
+        else:
+            self._normalize_cache.move_to_end(cle)
+        
+        # Copie des métadonnées : les appelants peuvent les modifier sans altérer le cache
+        nom_final, metadata = resultat
+        return nom_final, _copier_metadata(metadata)
+    
+    def normalize_person_names_batch(self, noms: List[str], appliquer_corrections_ocr: bool = True) -> List[Tuple[str, Dict]]:
+        """
+        Normalise une liste de noms (registre complet) en un seul appel
+        
+        Chaque nom distinct n'est normalisé qu'une fois ; les doublons reçoivent
+        leur propre copie des métadonnées.
+        
+        Args:
+            noms: Noms à normaliser
+            appliquer_corrections_ocr: Appliquer les corrections OCR
+            
+        Returns:
+            List[Tuple[str, Dict]]: (nom_normalisé, métadonnées) dans l'ordre des noms
+        """
+        normalize = self.normalize_person_name
+        resultats = {}
+        sortie = []
+        for nom in noms:
+            resultat = resultats.get(nom)
+            if resultat is None:
+                resultat = resultats[nom] = normalize(nom, appliquer_corrections_ocr)
+                sortie.append(resultat)
+            else:
+                sortie.append((resultat[0], _copier_metadata(resultat[1])))
+        return sortie
+    
+    def _normaliser_nom(self, nom: str, appliquer_corrections_ocr: bool) -> Tuple[str, Dict]:
+        """Normalisation effective d'un nom (sans cache)"""
         if not nom or not isinstance(nom, str):
             raise ValueError("Le nom doit être une chaîne non vide")
         
@@ -360,7 +565,7 @@ class PersonManager:
         
         try:
             # 1. Normalisation Unicode (NFD -> NFC)
-            nom_etape1 = unicodedata.normalize('NFC', nom_original)
+            nom_etape1 = _nfc(nom_original)
             metadata['etapes_traitement'].append('unicode_normalization')
             
             # 2. Corrections OCR en premier (si activées)
@@ -383,8 +588,8 @@ class PersonManager:
             metadata['variantes_historiques_resolues'] = variantes_resolues
             metadata['etapes_traitement'].append('variantes_resolution')
             
-            # 5. Nettoyage final et capitalisation
-            nom_final = self._nettoyage_final(nom_etape4)
+            # 5. Nettoyage final et capitalisation (chaîne partagée entre les personnes homonymes)
+            nom_final = sys.intern(self._nettoyage_final(nom_etape4))
             metadata['etapes_traitement'].append('final_cleaning')
             
             # 6. Validation et calcul de confiance
@@ -410,17 +615,19 @@ class PersonManager:
     def _appliquer_corrections_ocr(self, nom: str) -> Tuple[str, List[str]]:
         """Applique les corrections OCR spécifiques avec optimisations"""
         
-        nom_corrige = nom
-        corrections_appliquees = []
+        corrections = self.corrections_ocr_noms
+        occurrences = Counter()
         
-        # Corrections exactes (priorité haute) - optimisées
-        for erreur, correction in self.corrections_ocr_noms.items():
-            if erreur in nom_corrige:
-                # Utiliser replace avec comptage pour éviter les remplacements multiples
-                occurrences = nom_corrige.count(erreur)
-                if occurrences > 0:
-                    nom_corrige = nom_corrige.replace(erreur, correction)
-                    corrections_appliquees.append(f"{erreur} → {correction} ({occurrences}x)")
+        def _corriger(match):
+            erreur = match.group(0)
+            occurrences[erreur] += 1
+            return corrections[erreur]
+        
+        # Corrections exactes (priorité haute) - un seul passage sur le nom
+        nom_corrige = self.compiled_patterns['corrections_ocr'].sub(_corriger, nom)
+        corrections_appliquees = [
+            f"{erreur} → {corrections[erreur]} ({nombre}x)" for erreur, nombre in occurrences.items()
+        ]
         
         # Corrections contextuelles pour noms tronqués
         if self.compiled_patterns['nom_tronque'].search(nom_corrige):
@@ -436,44 +643,27 @@ class PersonManager:
     def _completer_nom_tronque(self, nom_tronque: str) -> str:
         """Tentative de complétion intelligente des noms tronqués"""
         
-        # Cache des complétions pour éviter les recalculs
-        cache_key = f"completion_{nom_tronque}"
-        if cache_key in self.name_variations_cache:
-            return self.name_variations_cache[cache_key]
-        
-        # Recherche dans les variantes historiques
-        for nom_complet, variantes in self.variantes_historiques.items():
-            if any(var.startswith(nom_tronque) for var in variantes):
-                self.name_variations_cache[cache_key] = nom_complet
-                return nom_complet
-        
-        # Heuristiques basées sur les patterns courants (enrichies)
-        completions_courantes = {
-            'Alex': 'Alexandre',
-            'Cath': 'Catherine', 
-            'Fran': 'François',
-            'Guil': 'Guillaume',
-            'Madel': 'Madeleine',
-            'Antho': 'Antoine',
-            'Nico': 'Nicolas',
-            'Marg': 'Marguerite',
-            'Pier': 'Pierre',
-            'Jacq': 'Jacques',
-            'Mich': 'Michel',
-            'Phil': 'Philippe',
-            'Char': 'Charles',
-            'Lou': 'Louis',
-            'Hen': 'Henri'
-        }
-        
-        for debut, complet in completions_courantes.items():
-            if nom_tronque.startswith(debut):
-                self.name_variations_cache[cache_key] = complet
-                return complet
+        # Recherche dans les variantes historiques : nom_tronque préfixe d'une variante
+        noeud = self._trie_variantes
+        for caractere in nom_tronque:
+            noeud = noeud.get(caractere)
+            if noeud is None:
+                break
+        else:
+            return noeud[None]
+        
+        # Heuristiques basées sur les patterns courants : début connu de nom_tronque
+        noeud = self._trie_debuts
+        completion = None
+        for caractere in nom_tronque:
+            noeud = noeud.get(caractere)
+            if noeud is None:
+                break
+            if None in noeud and (completion is None or noeud[None] < completion):
+                completion = noeud[None]
         
         # Aucune complétion trouvée
-        self.name_variations_cache[cache_key] = nom_tronque
-        return nom_tronque
+        return completion[1] if completion else nom_tronque
     
     def _normaliser_titres_particules(self, nom: str) -> Tuple[str, Dict]:
         """Normalise les titres et particules avec patterns pré-compilés"""
@@ -487,15 +677,11 @@ class PersonManager:
         
         nom_travail = nom
         
-        # Extraire et normaliser les titres en préfixe (optimisé)
-        for titre_brut, titre_normalise in self.normalization_rules['titres_prefixes'].items():
-            pattern_key = f'titre_{titre_brut}'
-            if pattern_key in self.compiled_patterns:
-                pattern = self.compiled_patterns[pattern_key]
-                if pattern.match(nom_travail):
-                    titres_extraits['titre_principal'] = titre_normalise
-                    nom_travail = pattern.sub('', nom_travail).strip()
-                    break
+        # Extraire et normaliser le titre en préfixe (un seul match)
+        match = self.compiled_patterns['titres'].match(nom_travail)
+        if match:
+            titres_extraits['titre_principal'] = self._titres_normalises[match.lastindex - 1]
+            nom_travail = nom_travail[match.end():].strip()
         
         # Identifier les particules
         mots = nom_travail.split()
@@ -509,11 +695,8 @@ class PersonManager:
             else:
                 mots_nettoyes.append(mot)
         
-        # Nettoyer les suffixes professionnels (optimisé)
-        nom_sans_suffixes = ' '.join(mots_nettoyes)
-        for i, pattern_key in enumerate([k for k in self.compiled_patterns.keys() if k.startswith('suffixe_')]):
-            pattern = self.compiled_patterns[pattern_key]
-            nom_sans_suffixes = pattern.sub('', nom_sans_suffixes)
+        # Nettoyer les suffixes professionnels (un seul passage)
+        nom_sans_suffixes = self.compiled_patterns['suffixes'].sub('', ' '.join(mots_nettoyes))
         
         titres_extraits['nom_sans_titre'] = nom_sans_suffixes.strip()
         
@@ -524,21 +707,22 @@ class PersonManager:
         
         cache_key = f"variantes_{nom}"
         if cache_key in self.name_variations_cache:
+            self.name_variations_cache.move_to_end(cache_key)
             cached_result = self.name_variations_cache[cache_key]
             return cached_result['nom'], cached_result['variantes']
         
-        variantes_resolues = []
-        nom_resolu = nom
+        variantes_resolues = {}
         
-        # Recherche dans le dictionnaire des variantes (optimisée)
-        for nom_standard, variantes in self.variantes_historiques.items():
-            for variante in variantes:
-                if variante.lower() in nom.lower():
-                    # Remplacer en préservant la casse
-                    pattern = re.compile(re.escape(variante), re.IGNORECASE)
-                    if pattern.search(nom_resolu):
-                        nom_resolu = pattern.sub(nom_standard, nom_resolu)
-                        variantes_resolues.append(f"{variante} → {nom_standard}")
+        def _resoudre(match):
+            variante = match.group(0)
+            nom_standard = self._variante_vers_canonique[variante.lower()]
+            if variante != nom_standard:
+                variantes_resolues[f"{variante} → {nom_standard}"] = None
+            return nom_standard
+        
+        # Un seul passage : mots entiers uniquement, variantes les plus longues d'abord
+        nom_resolu = self.compiled_patterns['variantes_historiques'].sub(_resoudre, nom)
+        variantes_resolues = list(variantes_resolues)
         
         # Mettre en cache
         result = {'nom': nom_resolu, 'variantes': variantes_resolues}
@@ -567,9 +751,6 @@ class PersonManager:
                     mots_capitalises.append(mot.capitalize())
                 else:
                     mots_capitalises.append(mot.lower())
-            elif mot.upper() in ['LE', 'LA', 'DU', 'DE', 'DES']:
-                # Particules importantes : capitalisation spéciale
-                mots_capitalises.append(mot.capitalize())
             else:
                 # Noms normaux : première lettre majuscule
                 mots_capitalises.append(mot.capitalize())
@@ -630,13 +811,13 @@ class PersonManager:
             # Normaliser le nom avec corrections OCR
             nom_normalise, metadata_normalisation = self.normalize_person_name(nom_complet)
             
-            # Clé de cache
-            cache_key = nom_normalise.lower()
+            # Clé de cache (internée : comparaison par identité dans les index)
+            cache_key = sys.intern(nom_normalise.lower())
             
             # Vérifier le cache d'abord
             if cache_key in self.persons_cache:
                 self.stats['cache_hits'] += 1
-                self._cache_access_count[cache_key] += 1
+                self.persons_cache.move_to_end(cache_key)
                 personne_existante = self.persons_cache[cache_key]
                 
                 # Mettre à jour avec nouvelles informations
@@ -654,16 +835,14 @@ class PersonManager:
                 # Mettre à jour avec nouvelles informations
                 self._mettre_a_jour_personne(personne_existante, extra_info, metadata_normalisation)
                 # Ajouter au cache avec la nouvelle clé
-                self.persons_cache[cache_key] = personne_existante
-                self._cache_access_count[cache_key] = 1
+                self._mettre_en_cache(cache_key, personne_existante)
                 return personne_existante
             
             # Créer nouvelle personne
             nouvelle_personne = self._creer_nouvelle_personne(nom_normalise, extra_info, metadata_normalisation)
             
             # Mettre en cache et gérer la mémoire
-            self.persons_cache[cache_key] = nouvelle_personne
-            self._cache_access_count[cache_key] = 1
+            self._mettre_en_cache(cache_key, nouvelle_personne)
             self._manage_cache_memory()
             
             self.stats['total_persons'] += 1
@@ -678,8 +857,9 @@ class PersonManager:
     def _rechercher_personne_existante(self, nom_normalise: str, extra_info: Optional[Dict]) -> Optional[Person]:
         """Recherche une personne existante avec tolérance aux variantes et optimisations"""
         
-        # Recherche avec variations orthographiques
-        for nom_cache, personne in self.persons_cache.items():
+        # Recherche avec variations orthographiques, limitée au bloc du nom
+        for nom_cache in self._blocs.get(self._cle_blocage(nom_normalise), ()):
+            personne = self.persons_cache[nom_cache]
             if self._noms_similaires(nom_normalise, personne.nom_complet):
                 # Vérifier cohérence avec extra_info si disponible
                 if self._informations_coherentes(personne, extra_info):
@@ -687,12 +867,61 @@ class PersonManager:
         
         return None
     
+    def _cle_blocage(self, nom: str) -> str:
+        """Clé de blocage : trois premières lettres du dernier mot hors particules"""
+        return _cle_blocage_nom(nom, self.normalization_rules['particules'])
+    
+    def _mettre_en_cache(self, cache_key: str, personne: Person):
+        """Ajoute une personne au cache et aux index"""
+        if self.persons_cache.get(cache_key, personne) is not personne:
+            self._retirer_du_cache(cache_key)
+        if cache_key not in self.persons_cache:
+            self._somme_confiances += personne.confiance
+        self.persons_cache[cache_key] = personne
+        self._cles_par_personne.setdefault(id(personne), {})[cache_key] = None
+        bloc = self._cle_blocage(personne.nom_complet)
+        self._bloc_par_cle[cache_key] = bloc
+        self._blocs[bloc][cache_key] = None
+        self._blocs_a_verifier.add(bloc)
+    
+    def _retirer_du_cache(self, cache_key: str):
+        """Retire une clé du cache et des index"""
+        personne = self.persons_cache.pop(cache_key, None)
+        if personne is not None:
+            self._somme_confiances -= personne.confiance
+            cles = self._cles_par_personne.get(id(personne))
+            if cles is not None:
+                cles.pop(cache_key, None)
+                if not cles:
+                    del self._cles_par_personne[id(personne)]
+        bloc = self._bloc_par_cle.pop(cache_key, None)
+        if bloc is not None:
+            cles_bloc = self._blocs[bloc]
+            cles_bloc.pop(cache_key, None)
+            if not cles_bloc:
+                del self._blocs[bloc]
+    
+    def _reindexer_blocs(self):
+        """Reconstruit l'index de blocage après modification des noms"""
+        self._blocs.clear()
+        self._bloc_par_cle.clear()
+        for cache_key, personne in self.persons_cache.items():
+            bloc = self._cle_blocage(personne.nom_complet)
+            self._bloc_par_cle[cache_key] = bloc
+            self._blocs[bloc][cache_key] = None
+        self._blocs_a_verifier.update(self._blocs)
+    
+    def _marquer_a_verifier(self, personne: Person):
+        """Signale les blocs d'une personne modifiée à la prochaine détection de doublons"""
+        for cache_key in self._cles_par_personne.get(id(personne), ()):
+            self._blocs_a_verifier.add(self._bloc_par_cle[cache_key])
+    
     def _noms_similaires(self, nom1: str, nom2: str, seuil_similarite: float = 0.85) -> bool:
         """Détermine si deux noms sont similaires avec algorithme amélioré"""
         
         # Normaliser pour comparaison
-        nom1_norm = re.sub(r'\s+', ' ', nom1.lower().strip())
-        nom2_norm = re.sub(r'\s+', ' ', nom2.lower().strip())
+        nom1_norm = _forme_comparaison(nom1)
+        nom2_norm = _forme_comparaison(nom2)
         
         # Comparaison exacte
         if nom1_norm == nom2_norm:
@@ -705,6 +934,11 @@ class PersonManager:
         if nom1_sans_part == nom2_sans_part:
             return True
         
+        # Écart de longueur rédhibitoire : le score ne peut dépasser min/max
+        longueur1, longueur2 = len(nom1_norm), len(nom2_norm)
+        if min(longueur1, longueur2) / max(longueur1, longueur2) < seuil_similarite:
+            return False
+        
         # Similarité de Levenshtein simplifiée
         return self._distance_levenshtein_simple(nom1_norm, nom2_norm) >= seuil_similarite
     
@@ -716,8 +950,8 @@ class PersonManager:
         if len(s2) == 0:
             return 0.0
         
-        # Algorithme simplifié pour performance
-        chars_communs = sum(1 for c1, c2 in zip(s1, s2) if c1 == c2)
+        # Algorithme simplifié pour performance (comparaison caractère à caractère en C)
+        chars_communs = sum(map(eq, s1, s2))
         longueur_max = max(len(s1), len(s2))
         
         return chars_communs / longueur_max
@@ -781,13 +1015,15 @@ class PersonManager:
         if len(mots) == 1:
             return [], mots[0], ""
         
-        # Identifier les particules
+        # Identifier les particules (chaque mot n'est mis en minuscules qu'une fois)
+        particules_connues = self.normalization_rules['particules']
         particules = []
         autres_mots = []
         
         for mot in mots:
-            if mot.lower() in self.normalization_rules['particules']:
-                particules.append(mot.lower())
+            mot_lower = mot.lower()
+            if mot_lower in particules_connues:
+                particules.append(mot_lower)
             else:
                 autres_mots.append(mot)
         
@@ -811,12 +1047,10 @@ class PersonManager:
         
         if extra_info:
             self._appliquer_informations_additionnelles(personne, extra_info)
+            self._marquer_a_verifier(personne)
         
-        # Mettre à jour les métadonnées de normalisation
-        if hasattr(personne, 'metadata_normalisation'):
-            personne.metadata_normalisation.update(metadata_normalisation)
-        else:
-            personne.metadata_normalisation = metadata_normalisation
+        # Mettre à jour les métadonnées de normalisation (champ toujours initialisé)
+        personne.metadata_normalisation.update(metadata_normalisation)
         
         # Recalculer la confiance globale
         self._recalculer_confiance_personne(personne)
@@ -852,22 +1086,26 @@ class PersonManager:
             # Professions
             if 'professions' in extra_info:
                 if isinstance(extra_info['professions'], list):
-                    personne.professions.extend([
-                        Profession(nom=prof) if isinstance(prof, str) else prof 
-                        for prof in extra_info['professions']
-                    ])
+                    for prof in extra_info['professions']:
+                        personne.ajouter_profession(self._profession_partagee(prof) if isinstance(prof, str) else prof)
                 elif isinstance(extra_info['professions'], str):
-                    personne.professions.append(Profession(nom=extra_info['professions']))
+                    personne.ajouter_profession(self._profession_partagee(extra_info['professions']))
             
             # Sources
             if 'source' in extra_info:
-                if extra_info['source'] not in personne.sources:
-                    personne.sources.append(str(extra_info['source']))
+                personne.ajouter_source(str(extra_info['source']))
             
         except Exception as e:
             self.logger.warning(f"Erreur lors de l'application des informations additionnelles: {e}")
             self.stats['errors_handled'] += 1
     
+    def _profession_partagee(self, nom: str) -> Profession:
+        """Profession sans précision (nom seul), partagée par toutes les personnes qui l'exercent"""
+        profession = self._professions_partagees.get(nom)
+        if profession is None:
+            profession = self._professions_partagees[nom] = Profession(nom=nom)
+        return profession
+    
     def _parse_date(self, date_input: Union[str, date, datetime]) -> Optional[Union[str, date]]:
         """Parse une date depuis différents formats"""
         
@@ -876,8 +1114,8 @@ class PersonManager:
         
         if isinstance(date_input, str):
             # Tentative de parsing de dates françaises
-            # Format simple pour l'exemple
-            return date_input.strip()
+            # Format simple pour l'exemple (chaîne vide ou blanche : pas de date)
+            return date_input.strip() or None
         
         return None
     
@@ -887,35 +1125,10 @@ class PersonManager:
         if not isinstance(statut_str, str):
             return None
         
-        statut_lower = statut_str.lower().strip()
-        
-        # Mappings normalisés avec corrections OCR
-        mappings_statut = {
-            'seigneur': PersonStatus.SEIGNEUR,
-            'sgr': PersonStatus.SEIGNEUR,
-            'messire': PersonStatus.SEIGNEUR,
-            'ecuyer': PersonStatus.ECUYER,
-            'écuyer': PersonStatus.ECUYER,
-            'éc.': PersonStatus.ECUYER,
-            'ec.': PersonStatus.ECUYER,
-            'sieur': PersonStatus.SIEUR,
-            'sr': PersonStatus.SIEUR,
-            'damoiselle': PersonStatus.DAMOISELLE,
-            'bourgeois': PersonStatus.BOURGEOIS,
-            'marchand': PersonStatus.MARCHAND,
-            'laboureur': PersonStatus.LABOUREUR,
-            'prêtre': PersonStatus.PRETRE,
-            'pretre': PersonStatus.PRETRE,
-            'curé': PersonStatus.PRETRE,
-            'cure': PersonStatus.PRETRE
-        }
-        
-        for pattern, status in mappings_statut.items():
-            if pattern in statut_lower:
-                self.stats['status_corrections'] += 1
-                return status
-        
-        return None
+        status = _statut_depuis_texte(statut_str)
+        if status is not None:
+            self.stats['status_corrections'] += 1
+        return status
     
     def _parse_gender(self, genre_input: Union[str, Gender]) -> Gender:
         """Parse le genre depuis différents formats"""
@@ -924,11 +1137,7 @@ class PersonManager:
             return genre_input
         
         if isinstance(genre_input, str):
-            genre_lower = genre_input.lower().strip()
-            if genre_lower in ['m', 'masculin', 'homme', 'h']:
-                return Gender.MASCULIN
-            elif genre_lower in ['f', 'féminin', 'feminin', 'femme']:
-                return Gender.FEMININ
+            return _genre_depuis_texte(genre_input)
         
         return Gender.INCONNU
     
@@ -947,32 +1156,46 @@ class PersonManager:
         if len(personne.sources) > 1:
             confiance_base += 0.1
         
-        personne.confiance = min(1.0, confiance_base)
+        # Répercuter la variation sur chaque entrée du cache qui référence la personne
+        confiance = min(1.0, confiance_base)
+        self._somme_confiances += (confiance - personne.confiance) * len(self._cles_par_personne.get(id(personne), ()))
+        personne.confiance = confiance
     
     def _detecter_et_fusionner_doublons(self) -> int:
         """Détecte et fusionne les doublons potentiels dans le cache"""
         
         doublons_fusionnes = 0
-        personnes_list = list(self.persons_cache.values())
         
-        for i, personne1 in enumerate(personnes_list):
-            for j, personne2 in enumerate(personnes_list[i+1:], i+1):
-                if self._sont_doublons(personne1, personne2):
-                    # Fusionner personne2 dans personne1
-                    self._fusionner_personnes(personne1, personne2)
-                    
-                    # Supprimer personne2 du cache
-                    key_to_remove = None
-                    for key, value in self.persons_cache.items():
-                        if value is personne2:
-                            key_to_remove = key
-                            break
-                    
-                    if key_to_remove:
-                        del self.persons_cache[key_to_remove]
-                        self._cache_access_count.pop(key_to_remove, None)
-                    
-                    doublons_fusionnes += 1
+        # Seuls les blocs modifiés depuis la dernière détection sont comparés
+        blocs_a_verifier, self._blocs_a_verifier = self._blocs_a_verifier, set()
+        blocs = self._blocs
+        cache = self.persons_cache
+        sont_doublons = self._sont_doublons
+        
+        for bloc in blocs_a_verifier:
+            cles_bloc = blocs.get(bloc)
+            if not cles_bloc or len(cles_bloc) < 2:
+                continue
+            
+            membres = [cache[cache_key] for cache_key in cles_bloc]
+            fusionnees = set()
+            for i, personne1 in enumerate(membres):
+                if id(personne1) in fusionnees:
+                    continue
+                for personne2 in membres[i+1:]:
+                    if personne2 is personne1 or id(personne2) in fusionnees:
+                        continue
+                    if sont_doublons(personne1, personne2):
+                        # Fusionner personne2 dans personne1
+                        self._fusionner_personnes(personne1, personne2)
+                        fusionnees.add(id(personne2))
+                        doublons_fusionnes += 1
+            
+            # Supprimer du cache toutes les clés des personnes fusionnées
+            for personne in membres:
+                if id(personne) in fusionnees:
+                    for cache_key in list(self._cles_par_personne.get(id(personne), ())):
+                        self._retirer_du_cache(cache_key)
         
         self.stats['duplicates_merged'] += doublons_fusionnes
         return doublons_fusionnes
@@ -980,11 +1203,7 @@ class PersonManager:
     def _sont_doublons(self, personne1: Person, personne2: Person) -> bool:
         """Détermine si deux personnes sont des doublons"""
         
-        # Similarité des noms
-        if not self._noms_similaires(personne1.nom_complet, personne2.nom_complet, 0.90):
-            return False
-        
-        # Vérifier cohérence des dates
+        # Vérifier cohérence des dates (tests simples avant la comparaison des noms)
         if (personne1.date_naissance and personne2.date_naissance and 
             personne1.date_naissance != personne2.date_naissance):
             return False
@@ -994,15 +1213,15 @@ class PersonManager:
             personne1.lieu_naissance.lower() != personne2.lieu_naissance.lower()):
             return False
         
-        return True
+        # Similarité des noms
+        return self._noms_similaires(personne1.nom_complet, personne2.nom_complet, 0.90)
     
     def _fusionner_personnes(self, personne_principale: Person, personne_secondaire: Person):
         """Fusionne les informations de deux personnes"""
         
         # Fusionner les sources
         for source in personne_secondaire.sources:
-            if source not in personne_principale.sources:
-                personne_principale.sources.append(source)
+            personne_principale.ajouter_source(source)
         
         # Compléter les informations manquantes
         if not personne_principale.date_naissance and personne_secondaire.date_naissance:
@@ -1013,8 +1232,7 @@ class PersonManager:
         
         # Fusionner les professions
         for profession in personne_secondaire.professions:
-            if not any(p.nom == profession.nom for p in personne_principale.professions):
-                personne_principale.professions.append(profession)
+            personne_principale.ajouter_profession(profession)
         
         # Recalculer la confiance
         self._recalculer_confiance_personne(personne_principale)
@@ -1049,8 +1267,7 @@ class PersonManager:
         if not self.persons_cache:
             return 0.0
         
-        total_confidence = sum(person.confiance for person in self.persons_cache.values())
-        return total_confidence / len(self.persons_cache)
+        return self._somme_confiances / len(self.persons_cache)
     
     def validate_and_improve_existing_data(self) -> Dict:
         """Valide et améliore les données existantes en lot"""
@@ -1063,26 +1280,37 @@ class PersonManager:
         }
         
         try:
-            # Traitement en lot de toutes les personnes en cache
-            personnes_a_revalider = list(self.persons_cache.values())
+            # Traitement en lot de toutes les personnes en cache (une fois par personne, alias compris)
+            personnes_a_revalider = list({id(personne): personne for personne in self.persons_cache.values()}.values())
+            recalculer_confiance = self._recalculer_confiance_personne
+            mises_a_jour = corrections_retroactives = confiance_amelioree = 0
+            
+            # Re-normaliser les noms avec corrections OCR, en un lot (chaque nom distinct une fois)
+            noms_normalises = self.normalize_person_names_batch([personne.nom_complet for personne in personnes_a_revalider])
             
-            for personne in personnes_a_revalider:
+            # Puis appliquer les résultats personne par personne
+            for personne, (nom_ameliore, metadata) in zip(personnes_a_revalider, noms_normalises):
                 confiance_initiale = personne.confiance
                 
-                # Re-normaliser le nom avec corrections OCR
-                nom_ameliore, metadata = self.normalize_person_name(personne.nom_complet)
-                
                 if nom_ameliore != personne.nom_complet:
                     personne.nom_complet = nom_ameliore
-                    ameliorations['personnes_mises_a_jour'] += 1
+                    mises_a_jour += 1
                     
                     if metadata.get('corrections_ocr_appliquees'):
-                        ameliorations['corrections_ocr_retroactives'] += 1
+                        corrections_retroactives += 1
                 
                 # Recalculer la confiance
-                self._recalculer_confiance_personne(personne)
+                recalculer_confiance(personne)
                 if personne.confiance > confiance_initiale:
-                    ameliorations['confiance_amelioree'] += 1
+                    confiance_amelioree += 1
+            
+            ameliorations['personnes_mises_a_jour'] = mises_a_jour
+            ameliorations['corrections_ocr_retroactives'] = corrections_retroactives
+            ameliorations['confiance_amelioree'] = confiance_amelioree
+            
+            # Les noms ont pu changer : remettre à jour l'index de blocage
+            if mises_a_jour:
+                self._reindexer_blocs()
             
             # Détecter et fusionner les doublons potentiels
             doublons_fusionnes = self._detecter_et_fusionner_doublons()
@@ -1100,48 +1328,40 @@ class PersonManager:
     def export_persons_summary(self) -> Dict:
         """Exporte un résumé de toutes les personnes gérées"""
         
-        summary = {
-            'total_persons': len(self.persons_cache),
-            'by_status': defaultdict(int),
-            'by_gender': defaultdict(int),
-            'with_birth_date': 0,
-            'with_death_date': 0,
-            'with_professions': 0,
-            'average_confidence': self._calculate_average_confidence(),
-            'top_surnames': Counter(),
-            'top_given_names': Counter()
-        }
+        personnes = self.persons_cache.values()
+        by_status = {}
+        by_gender = {}
+        with_birth_date = with_death_date = with_professions = 0
         
-        for person in self.persons_cache.values():
-            # Statuts
+        # Un seul passage pour les compteurs simples
+        for person in personnes:
             if person.statut:
-                summary['by_status'][person.statut.value] += 1
-            
-            # Genres
-            summary['by_gender'][person.genre.value] += 1
-            
-            # Dates
+                statut = person.statut.value
+                by_status[statut] = by_status.get(statut, 0) + 1
+            genre = person.genre.value
+            by_gender[genre] = by_gender.get(genre, 0) + 1
             if person.date_naissance:
-                summary['with_birth_date'] += 1
+                with_birth_date += 1
             if person.date_deces:
-                summary['with_death_date'] += 1
-            
-            # Professions
+                with_death_date += 1
             if person.professions:
-                summary['with_professions'] += 1
-            
-            # Noms
-            if person.nom_famille:
-                summary['top_surnames'][person.nom_famille] += 1
-            
-            for prenom in person.prenoms:
-                summary['top_given_names'][prenom] += 1
+                with_professions += 1
+        
+        # Noms : Counter construit depuis des générateurs (comptage en C)
+        top_surnames = Counter(person.nom_famille for person in personnes if person.nom_famille)
+        top_given_names = Counter(chain.from_iterable(person.prenoms for person in personnes))
         
-        # Convertir Counter en dict pour JSON
-        summary['top_surnames'] = dict(summary['top_surnames'].most_common(20))
-        summary['top_given_names'] = dict(summary['top_given_names'].most_common(20))
-        summary['by_status'] = dict(summary['by_status'])
-        summary['by_gender'] = dict(summary['by_gender'])
+        summary = {
+            'total_persons': len(self.persons_cache),
+            'by_status': by_status,
+            'by_gender': by_gender,
+            'with_birth_date': with_birth_date,
+            'with_death_date': with_death_date,
+            'with_professions': with_professions,
+            'average_confidence': self._calculate_average_confidence(),
+            'top_surnames': dict(top_surnames.most_common(20)),
+            'top_given_names': dict(top_given_names.most_common(20))
+        }
         
         return summary
     
@@ -1149,9 +1369,13 @@ class PersonManager:
         """Vide tous les caches pour libérer la mémoire"""
         self.persons_cache.clear()
         self.name_variations_cache.clear()
-        self._cache_access_count.clear()
-        # Vider aussi le cache LRU de normalize_person_name
-        self.normalize_person_name.cache_clear()
+        self._blocs.clear()
+        self._bloc_par_cle.clear()
+        self._cles_par_personne.clear()
+        self._blocs_a_verifier.clear()
+        self._somme_confiances = 0.0
+        # Vider aussi le cache de normalize_person_name
+        self._normalize_cache.clear()
         
         self.logger.info("Tous les caches ont été vidés")
 
@@ -37,6 +37,12 @@ logging.basicConfig(
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
 )
 
+PERSON_NAME_PATTERN = re.compile(
+    r'\b[A-ZÀÁÂÃÄÅÆÇÈÉÊËÌÍÎÏÐÑÒÓÔÕÖØÙÚÛÜÝÞ][a-zàáâãäåæçèéêëìíîïðñòóôõöøùúûüýþÿ]+'
+    r'(?:\s+[A-ZÀÁÂÃÄÅÆÇÈÉÊËÌÍÎÏÐÑÒÓÔÕÖØÙÚÛÜÝÞ][a-zàáâãäåæçèéêëìíîïðñòóôõöøùúûüýþÿ]+)+'
+)
+WHITESPACE_PATTERN = re.compile(r'\s+')
+
 @dataclass
 class PageAnalysis:
     page_number: int
@@ -655,14 +661,11 @@ class PDFAnalyzer:
         }
     
     def _extract_persons_basic(self, text: str) -> List[Dict]:
-        name_pattern = r'\b[A-ZÀÁÂÃÄÅÆÇÈÉÊËÌÍÎÏÐÑÒÓÔÕÖØÙÚÛÜÝÞ][a-zàáâãäåæçèéêëìíîïðñòóôõöøùúûüýþÿ]+'
-        name_pattern += r'(?:\s+[A-ZÀÁÂÃÄÅÆÇÈÉÊËÌÍÎÏÐÑÒÓÔÕÖØÙÚÛÜÝÞ][a-zàáâãäåæçèéêëìíîïðñòóôõöøùúûüýþÿ]+)+'
-        
-        matches = re.findall(name_pattern, text)
+        matches = PERSON_NAME_PATTERN.findall(text)
         
         unique_persons = {}
-        for match in matches:
-            clean_name = re.sub(r'\s+', ' ', match.strip())
+        for match in dict.fromkeys(matches):
+            clean_name = WHITESPACE_PATTERN.sub(' ', match)
             if len(clean_name) > 3 and clean_name not in unique_persons:
                 words = clean_name.split()
                 unique_persons[clean_name] = {
@@ -825,6 +828,24 @@ def analyze_and_process_pdf_optimized(pdf_file: str, max_pages: Optional[int] =
         'error': result.error_message
     }
 
+CSV_WRITE_BUFFER = 1 << 20
+
+def _write_csv_rows(f, fieldnames: List[str], rows: List[Dict]):
+    import csv
+    from operator import itemgetter
+    
+    writer = csv.writer(f)
+    writer.writerow(fieldnames)
+    getter = itemgetter(*fieldnames)
+    single = len(fieldnames) == 1
+    for row in rows:
+        try:
+            values = (getter(row),) if single else getter(row)
+        except KeyError:
+            # Clé absente : cellule vide, comme le restval de DictWriter
+            values = [row.get(name, '') for name in fieldnames]
+        writer.writerow(values)
+
 def export_to_csv(result: Dict, output_dir: str = "RESULT") -> Dict[str, str]:
     if not result or not result.get('success', False):
         return {}
@@ -836,23 +857,16 @@ def export_to_csv(result: Dict, output_dir: str = "RESULT") -> Dict[str, str]:
     genealogical = result.get('resultats_genealogiques', {})
     
     if genealogical.get('filiations'):
-        import csv
         filiations_file = output_path / "filiations.csv"
-        with open(filiations_file, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.DictWriter(f, fieldnames=['ID', 'Child', 'Father', 'Mother', 'Confidence'])
-            writer.writeheader()
-            writer.writerows(genealogical['filiations'])
+        with open(filiations_file, 'w', newline='', encoding='utf-8', buffering=CSV_WRITE_BUFFER) as f:
+            _write_csv_rows(f, ['ID', 'Child', 'Father', 'Mother', 'Confidence'], genealogical['filiations'])
         csv_files['filiations'] = str(filiations_file)
     
     if genealogical.get('personnes_extraites'):
-        import csv
         persons_file = output_path / "personnes.csv"
-        with open(persons_file, 'w', newline='', encoding='utf-8') as f:
-            if genealogical['personnes_extraites']:
-                fieldnames = list(genealogical['personnes_extraites'][0].keys())
-                writer = csv.DictWriter(f, fieldnames=fieldnames)
-                writer.writeheader()
-                writer.writerows(genealogical['personnes_extraites'])
+        with open(persons_file, 'w', newline='', encoding='utf-8', buffering=CSV_WRITE_BUFFER) as f:
+            fieldnames = list(genealogical['personnes_extraites'][0].keys())
+            _write_csv_rows(f, fieldnames, genealogical['personnes_extraites'])
         csv_files['personnes'] = str(persons_file)
     
     return csv_files
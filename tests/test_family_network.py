@@ -0,0 +1,147 @@
+# tests/test_family_network.py
+import unittest
+from pathlib import Path
+import sys
+
+# Ajouter le répertoire parent au path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from core.models import Person
+from database.family_network import FamilyNetworkAnalyzer, UnionFind
+
+class TestUnionFind(unittest.TestCase):
+    """Tests pour la structure Union-Find"""
+
+    def test_union_find(self):
+        """Test regroupement et racines"""
+        union_find = UnionFind()
+        union_find.union(1, 2)
+        union_find.union(3, 4)
+        union_find.union(2, 4)
+        union_find.add(5)
+
+        self.assertEqual(union_find.find(1), union_find.find(3))
+        self.assertNotEqual(union_find.find(1), union_find.find(5))
+        self.assertEqual(list(union_find), [1, 2, 3, 4, 5])
+
+class TestFamilyNetwork(unittest.TestCase):
+    """Tests pour l'analyse du réseau familial"""
+
+    def setUp(self):
+        self.analyzer = FamilyNetworkAnalyzer(None)
+        self.persons = {
+            1: Person(id=1, prenoms=['Jean'], nom='Le Boucher', conjoint_id=2),
+            2: Person(id=2, prenoms=['Françoise'], nom='Varin', conjoint_id=1),
+            3: Person(id=3, prenoms=['Charlotte'], nom='Le Boucher', pere_id=1, mere_id=2),
+            4: Person(id=4, prenoms=['Pierre'], nom='Le Boucher', pere_id=1, mere_id=2),
+            5: Person(id=5, prenoms=['Marie'], nom='Hamel'),
+            6: Person(id=6, prenoms=['Guillaume'], nom='Hamel', pere_id=5),
+        }
+
+    def test_family_groups(self):
+        """Test composantes familiales dans l'ordre des personnes"""
+        network = self.analyzer.build_family_network(self.persons, {})
+
+        self.assertEqual(network.family_groups, [{1, 2, 3, 4}, {5, 6}])
+
+    def test_evidence(self):
+        """Test texte des preuves construit à la demande"""
+        network = self.analyzer.build_family_network(self.persons, {})
+        evidences = {(r.person1_id, r.person2_id, r.relation_type): r.get_evidence() for r in network.relations}
+
+        self.assertEqual(evidences[(1, 3, 'parent')], ["Père déclaré de Charlotte Le Boucher"])
+        self.assertEqual(evidences[(2, 4, 'parent')], ["Mère déclarée de Pierre Le Boucher"])
+        self.assertEqual(evidences[(1, 2, 'spouse')], ["Conjoint déclaré"])
+        self.assertEqual(evidences[(3, 4, 'sibling')], ["Enfants du même parent (ID: 2)"])
+
+    def test_grands_parents(self):
+        """Test grands-parents inférés par le père et par la mère"""
+        self.persons[1].pere_id = 5
+        self.persons[2].pere_id = 6
+
+        network = self.analyzer.build_family_network(self.persons, {})
+        grandparents = {(r.person1_id, r.person2_id) for r in network.relations if r.relation_type == 'grandparent'}
+
+        self.assertEqual(grandparents, {(5, 3), (6, 3), (5, 4), (6, 4), (5, 2)})
+
+    def test_generations(self):
+        """Test calcul des générations"""
+        network = self.analyzer.build_family_network(self.persons, {})
+
+        self.assertEqual(network.generations[1], 0)
+        self.assertEqual(network.generations[3], 1)
+        self.assertEqual(network.generations[6], 1)
+
+    def test_generations_parents_de_generations_differentes(self):
+        """Test génération d'un enfant dont les parents n'ont pas la même profondeur"""
+        self.persons[2].pere_id = 5
+
+        generations = self.analyzer.build_family_network(self.persons, {}).generations
+
+        self.assertEqual(generations[2], 1)
+        self.assertEqual(generations[3], 2)
+
+    def test_generations_cycle(self):
+        """Test cycle de filiation sans boucle infinie"""
+        self.persons[1].pere_id = 3
+
+        generations = self.analyzer.build_family_network(self.persons, {}).generations
+
+        self.assertEqual(generations[1], 0)
+        self.assertEqual(generations[3], 0)
+        self.assertEqual(generations[2], 0)
+        self.assertEqual(generations[6], 1)
+
+    def test_mariage_deja_declare(self):
+        """Test pas de mariage inféré quand un seul conjoint le déclare"""
+        self.persons[1].conjoint_id = None
+
+        network = self.analyzer.build_family_network(self.persons, {})
+        spouses = [r for r in network.relations if r.relation_type == 'spouse']
+
+        self.assertEqual([(r.person1_id, r.person2_id) for r in spouses], [(2, 1)])
+
+    def test_mariage_infere_identifiant_zero(self):
+        """Test mariage inféré quand un parent a l'identifiant 0"""
+        persons = {
+            0: Person(id=0, prenoms=['Jean'], nom='Le Boucher'),
+            2: Person(id=2, prenoms=['Françoise'], nom='Varin'),
+            3: Person(id=3, prenoms=['Charlotte'], nom='Le Boucher', pere_id=0, mere_id=2),
+        }
+
+        network = self.analyzer.build_family_network(persons, {})
+        spouses = [(r.person1_id, r.person2_id) for r in network.relations if r.relation_type == 'spouse']
+
+        self.assertEqual(spouses, [(0, 2)])
+
+    def test_find_common_ancestors(self):
+        """Test ancêtres communs de deux frère et soeur"""
+        network = self.analyzer.build_family_network(self.persons, {})
+
+        common = self.analyzer.find_common_ancestors(3, 4, network)
+
+        self.assertEqual(sorted(common), [(1, 2), (2, 2)])
+        self.assertEqual(self.analyzer.find_common_ancestors(3, 6, network), [])
+
+    def test_ancetre_commun_le_plus_proche(self):
+        """Test limitation aux k ancêtres communs les plus proches"""
+        self.persons[1].pere_id = 5
+        network = self.analyzer.build_family_network(self.persons, {})
+
+        self.assertEqual(len(self.analyzer.find_common_ancestors(3, 4, network)), 3)
+        self.assertEqual(self.analyzer.find_common_ancestors(3, 4, network, k=1)[0][1], 2)
+        self.assertEqual(self.analyzer.find_common_ancestors(3, 6, network, k=1), [(5, 3)])
+
+    def test_cache_ancetres(self):
+        """Test mise en cache et invalidation des ancêtres"""
+        network = self.analyzer.build_family_network(self.persons, {})
+
+        self.assertIs(network.get_ancestors(3), network.get_ancestors(3))
+
+        network.parent_of[1] = [5]
+        self.assertNotIn(5, network.get_ancestors(3))
+        network.invalidate_caches()
+        self.assertEqual(network.get_ancestors(3), {1: 1, 2: 1, 5: 2})
+
+if __name__ == '__main__':
+    unittest.main()
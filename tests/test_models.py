@@ -0,0 +1,158 @@
+# tests/test_models.py
+import unittest
+import tempfile
+import shutil
+import os
+from pathlib import Path
+import sys
+
+# Ajouter le répertoire parent au path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from core.models import ActeType, MultiPrenomUtils, Person, PersonStatus, PersonTable, RelationType
+
+class TestMultiPrenomUtils(unittest.TestCase):
+    """Tests pour le découpage prénoms / nom"""
+
+    def test_nom_avec_particule(self):
+        """Test nom de famille précédé d'une particule"""
+        prenoms, nom = MultiPrenomUtils.extract_prenoms_from_fullname("Jean Pierre Philippe Le Boucher")
+
+        self.assertEqual(prenoms, ['Jean', 'Pierre', 'Philippe'])
+        self.assertEqual(nom, 'Le Boucher')
+
+    def test_nom_seul(self):
+        """Test nom complet sans prénom"""
+        self.assertEqual(MultiPrenomUtils.extract_prenoms_from_fullname("Le Boucher"), ([], 'Le Boucher'))
+        self.assertEqual(MultiPrenomUtils.extract_prenoms_from_fullname("Jean"), ([], 'Jean'))
+
+    def test_dernier_mot_minuscule(self):
+        """Test repli sur le dernier mot quand il n'est pas capitalisé"""
+        prenoms, nom = MultiPrenomUtils.extract_prenoms_from_fullname("Jean dupont")
+
+        self.assertEqual(prenoms, ['Jean'])
+        self.assertEqual(nom, 'dupont')
+
+    def test_nom_vide(self):
+        """Test chaînes vides ou blanches"""
+        self.assertEqual(MultiPrenomUtils.extract_prenoms_from_fullname(""), ([], ""))
+        self.assertEqual(MultiPrenomUtils.extract_prenoms_from_fullname("   "), ([], ""))
+
+class TestEnums(unittest.TestCase):
+    """Tests pour la conversion des types depuis le texte brut"""
+
+    def test_type_acte_insensible_casse(self):
+        """Test lecture d'un type d'acte quelle que soit la casse"""
+        self.assertIs(ActeType("baptême"), ActeType.BAPTEME)
+        self.assertIs(ActeType(" Baptême "), ActeType.BAPTEME)
+        self.assertIs(RelationType("Père"), RelationType.PERE)
+
+    def test_type_acte_inconnu(self):
+        """Test type d'acte inconnu"""
+        with self.assertRaises(ValueError):
+            ActeType("testament")
+
+class TestPersonFamily(unittest.TestCase):
+    """Tests pour les relations familiales d'une personne"""
+
+    def test_get_all_family_ids(self):
+        """Test dictionnaire complet des relations"""
+        person = Person(id=1, pere_id=2, parrain_id=5)
+        person.add_family_relation(3, RelationType.FRERE)
+
+        family = person.get_all_family_ids()
+
+        self.assertEqual(len(family), 14)
+        self.assertEqual(family['père'], [2])
+        self.assertEqual(family['mère'], [])
+        self.assertEqual(family['parrain'], [5])
+        self.assertIs(family['frères'], person.freres_ids)
+
+    def test_iter_family_ids(self):
+        """Test itération sans construction du dictionnaire"""
+        person = Person(id=1, mere_id=4)
+
+        non_vides = {label: tuple(ids) for label, ids in person.iter_family_ids() if ids}
+
+        self.assertEqual(non_vides, {'mère': (4,)})
+
+    def test_from_ingest(self):
+        """Test création rapide puis ajout de relations"""
+        person = Person.from_ingest(['Charlotte'], 'Le Boucher', pere_id=2)
+        autre = Person.from_ingest(['Jean'], 'Le Boucher')
+
+        person.add_family_relation(3, RelationType.SOEUR)
+        person.add_source_event('baptême', 'Creully, BMS 1665-1701, p.12')
+
+        self.assertEqual(person.full_name, 'Charlotte Le Boucher')
+        self.assertEqual(person.get_all_family_ids()['père'], [2])
+        self.assertEqual(person.soeurs_ids, [3])
+        self.assertEqual(len(person.sources_events), 1)
+        self.assertFalse(autre.soeurs_ids)
+        self.assertFalse(autre.sources_events)
+        self.assertEqual(autre, Person(prenoms=['Jean'], nom='Le Boucher'))
+        autre.profession.append('laboureur')
+        self.assertEqual(autre.profession, ['laboureur'])
+        self.assertFalse(Person.from_ingest(['Jean'], 'Le Boucher').profession)
+
+        with self.assertRaises(TypeError):
+            Person.from_ingest([], 'Varin', peer_id=1)
+
+    def test_identifiant_zero(self):
+        """Test un identifiant 0 n'est pas traité comme absent"""
+        person = Person(id=1, pere_id=0)
+
+        self.assertEqual(person.get_all_family_ids()['père'], [0])
+
+class TestSourceEvents(unittest.TestCase):
+    """Tests pour les sources d'événements"""
+
+    def test_extend_source_events(self):
+        """Test ajout groupé depuis des dictionnaires ou des tuples"""
+        person = Person(id=1)
+        person.extend_source_events([
+            {'event_type': 'baptême', 'source_reference': 'Creully, BMS 1665-1701, p.12', 'date': '1651'},
+            ('mariage', '5 juillet 1677', 'Creully', 'Creully, BMS 1665-1701, p.34'),
+        ])
+
+        self.assertEqual(len(person.sources_events), 2)
+        self.assertEqual(person.get_sources_for_event('mariage')[0].lieu, 'Creully')
+
+class TestPersonTable(unittest.TestCase):
+    """Tests pour le stockage en colonnes des personnes"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_aller_retour(self):
+        """Test conversion personnes -> colonnes -> fichier -> personnes"""
+        persons = [
+            Person(id=1, prenoms=['Jean', 'Pierre'], nom='Le Boucher', statut=PersonStatus.ECUYER, freres_ids=[2, 3]),
+            Person(id=2, prenoms=['Charlotte'], nom='Le Boucher', pere_id=1),
+            Person(id=3, nom='Varin', mere_id=None),
+        ]
+        persons[1].add_source_event('baptême', 'Creully, BMS 1665-1701, p.34', date='24 oct. 1651')
+
+        table = PersonTable.from_persons(persons)
+        self.assertEqual(len(table), 3)
+        self.assertEqual(table.columns['pere_id'].tolist(), [-1, 1, -1])
+
+        path = os.path.join(self.temp_dir, 'persons.bin')
+        table.dump(path)
+
+        self.assertEqual(PersonTable.load(path).to_persons(), persons)
+
+    def test_grands_identifiants(self):
+        """Test identifiants au-delà de 2**31 conservés"""
+        persons = [Person(id=2**31, nom='Varin', conjoint_id=2**40, filleuls_ids=[2**33])]
+
+        path = os.path.join(self.temp_dir, 'persons.bin')
+        PersonTable.from_persons(persons).dump(path)
+
+        self.assertEqual(PersonTable.load(path).to_persons(), persons)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,176 @@
+# tests/test_person_manager.py
+import gc
+import unittest
+import weakref
+from pathlib import Path
+import sys
+
+# Ajouter le répertoire parent au path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from database.person_manager import Person, PersonManager, PersonStatus, Profession
+
+class TestNormalisationNoms(unittest.TestCase):
+    """Tests pour la normalisation des noms de personnes"""
+
+    def setUp(self):
+        self.manager = PersonManager()
+
+    def test_corrections_ocr(self):
+        """Test corrections OCR en un seul passage"""
+        nom, corrections = self.manager._appliquer_corrections_ocr("Catlierhie Aiimont, fille de Jaeques Aiimont")
+
+        self.assertEqual(nom, "Catherine Aumont, fille de Jacques Aumont")
+        self.assertEqual(corrections, [
+            "Catlierhie → Catherine (1x)",
+            "Aiimont → Aumont (2x)",
+            "Jaeques → Jacques (1x)",
+        ])
+
+    def test_corrections_ocr_cle_la_plus_longue(self):
+        """Test priorité à la correction la plus longue"""
+        nom, corrections = self.manager._appliquer_corrections_ocr("Aiicelle")
+
+        self.assertEqual(nom, "Ancelle")
+        self.assertEqual(corrections, ["Aiicelle → Ancelle (1x)"])
+
+    def test_completion_nom_tronque(self):
+        """Test complétion par variante historique puis par début connu"""
+        self.assertEqual(self.manager._completer_nom_tronque("Magd"), "Madeleine")
+        self.assertEqual(self.manager._completer_nom_tronque("Alexis"), "Alexandre")
+        self.assertEqual(self.manager._completer_nom_tronque("Xavier"), "Xavier")
+
+    def test_variantes_historiques_mots_entiers(self):
+        """Test variantes remplacées sur des mots entiers uniquement"""
+        nom, variantes = self.manager._resoudre_variantes_historiques("Pierre Jaques, fils de Jehan")
+
+        self.assertEqual(nom, "Pierre Jacques, fils de Jean")
+        self.assertEqual(variantes, ["Jaques → Jacques", "Jehan → Jean"])
+        self.assertEqual(self.manager._resoudre_variantes_historiques("Jeanne Annebault"), ("Jeanne Annebault", []))
+
+    def test_cache_normalisation_copie(self):
+        """Test métadonnées du cache protégées des modifications"""
+        nom, metadata = self.manager.normalize_person_name("Jeau Aiimont")
+        metadata['corrections_ocr_appliquees'].append('modifiée')
+        metadata['confiance_normalisation'] = 0.0
+
+        nom_bis, metadata_bis = self.manager.normalize_person_name("Jeau Aiimont")
+
+        self.assertEqual(nom_bis, nom)
+        self.assertEqual(len(metadata_bis['corrections_ocr_appliquees']), 2)
+        self.assertGreater(metadata_bis['confiance_normalisation'], 0.0)
+
+    def test_normalisation_par_lot(self):
+        """Test lot de noms avec doublons"""
+        noms = ["Jehan Aiimont", "Marie Varin", "Jehan Aiimont"]
+        resultats = self.manager.normalize_person_names_batch(noms)
+
+        self.assertEqual(resultats, [self.manager.normalize_person_name(nom) for nom in noms])
+        self.assertIsNot(resultats[0][1], resultats[2][1])
+
+    def test_cache_normalisation_par_instance(self):
+        """Test le cache ne retient pas le gestionnaire"""
+        manager = PersonManager()
+        manager.normalize_person_name("Jean Varin")
+        reference = weakref.ref(manager)
+
+        del manager
+        gc.collect()
+
+        self.assertIsNone(reference())
+
+class TestRecherchePersonnes(unittest.TestCase):
+    """Tests pour la recherche de personnes existantes"""
+
+    def setUp(self):
+        self.manager = PersonManager()
+
+    def test_personne_similaire_retrouvee(self):
+        """Test une variante proche retrouve la même personne"""
+        personne = self.manager.find_or_create_person("Jean Le Boucher")
+
+        self.assertIs(self.manager.find_or_create_person("Jean Le Bouchet"), personne)
+        self.assertIsNot(self.manager.find_or_create_person("Jean Varin"), personne)
+        self.assertEqual(self.manager._cle_blocage("Jean de la Roche"), "roc")
+
+    def test_index_blocage_apres_eviction(self):
+        """Test index de blocage cohérent avec le cache"""
+        self.manager.find_or_create_person("Jean Le Boucher")
+        self.manager.find_or_create_person("Louis Varin")
+        self.manager._retirer_du_cache("louis varin")
+
+        self.assertEqual(dict(self.manager._blocs), {"bou": {"jean le boucher": None}})
+        self.assertEqual(self.manager.find_or_create_person("Louis Varin").nom_complet, "Louis Varin")
+
+    def test_fusion_doublons_par_bloc(self):
+        """Test fusion des doublons d'un même bloc"""
+        personne = self.manager.find_or_create_person("Jean Le Boucher")
+        self.manager._mettre_en_cache("jean le bouchet", Person("Jean Le Bouchet", date_naissance="1651"))
+        self.manager._mettre_en_cache("louis varin", Person("Louis Varin"))
+
+        self.assertEqual(self.manager._detecter_et_fusionner_doublons(), 1)
+        self.assertEqual(list(self.manager.persons_cache), ["jean le boucher", "louis varin"])
+        self.assertEqual(personne.date_naissance, "1651")
+        self.assertEqual(self.manager._detecter_et_fusionner_doublons(), 0)
+
+    def test_fusion_doublons_incrementale(self):
+        """Test seuls les blocs modifiés sont revérifiés, toutes les clés du doublon sont retirées"""
+        self.manager.find_or_create_person("Jean Le Boucher")
+        self.manager._detecter_et_fusionner_doublons()
+        self.assertEqual(self.manager._blocs_a_verifier, set())
+
+        doublon = Person("Jean Le Bouchet")
+        self.manager._mettre_en_cache("jean le bouchet", doublon)
+        self.manager._mettre_en_cache("jehan le bouchet", doublon)
+
+        self.assertEqual(self.manager._blocs_a_verifier, {"bou"})
+        self.assertEqual(self.manager._detecter_et_fusionner_doublons(), 1)
+        self.assertEqual(list(self.manager.persons_cache), ["jean le boucher"])
+        self.assertNotIn(id(doublon), self.manager._cles_par_personne)
+
+    def test_eviction_lru(self):
+        """Test éviction de l'entrée la moins récemment utilisée"""
+        manager = PersonManager(cache_size=2)
+        manager.find_or_create_person("Jean Varin")
+        manager.find_or_create_person("Louis Hamel")
+        manager.find_or_create_person("Jean Varin")
+        manager.find_or_create_person("Charles Lair")
+
+        self.assertEqual(list(manager.persons_cache), ["jean varin", "charles lair"])
+        self.assertNotIn("ham", manager._blocs)
+
+class TestInformationsAdditionnelles(unittest.TestCase):
+    """Tests pour la lecture des informations additionnelles"""
+
+    def setUp(self):
+        self.manager = PersonManager()
+
+    def test_statut_par_priorite(self):
+        """Test statut retenu selon la priorité des motifs, pas leur position"""
+        self.assertEqual(self.manager._parse_status("Marchand, sieur de Creully"), PersonStatus.SIEUR)
+        self.assertEqual(self.manager._parse_status("curé"), PersonStatus.PRETRE)
+        self.assertIsNone(self.manager._parse_status("tisserand"))
+        self.assertEqual(self.manager.stats['status_corrections'], 2)
+
+    def test_sources_sans_doublon(self):
+        """Test sources et professions ajoutées une seule fois"""
+        personne = self.manager.find_or_create_person("Jean Varin", {'source': 'Creully, BMS 1665-1701, p.12', 'professions': 'marchand'})
+        self.manager.find_or_create_person("Jean Varin", {'source': 'Creully, BMS 1665-1701, p.12', 'professions': 'marchand'})
+        self.manager.find_or_create_person("Jean Varin", {'professions': ['marchand', Profession(nom='marchand', lieu='Caen')]})
+
+        self.assertEqual(personne.sources, ['Creully, BMS 1665-1701, p.12'])
+        self.assertEqual([p.nom for p in personne.professions], ['marchand'])
+        self.assertTrue(personne.ajouter_source('Creully, BMS 1665-1701, p.34'))
+        self.assertFalse(personne.ajouter_source('Creully, BMS 1665-1701, p.34'))
+        self.assertEqual(len(personne.sources), 2)
+
+    def test_professions_partagees(self):
+        """Test une seule instance par profession donnée sous forme de texte"""
+        jean = self.manager.find_or_create_person("Jean Varin", {'professions': 'marchand'})
+        louis = self.manager.find_or_create_person("Louis Hamel", {'professions': ['marchand', Profession(nom='laboureur', lieu='Creully')]})
+
+        self.assertIs(jean.professions[0], louis.professions[0])
+        self.assertEqual(louis.professions[1].lieu, 'Creully')
+
+if __name__ == '__main__':
+    unittest.main()